@@ -7,15 +7,62 @@
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
 import matplotlib.pyplot as plt
+from matplotlib.animation import FuncAnimation
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
 import numpy as np
-import random
 from datetime import datetime, timedelta
-import threading
-import time
+
+# =============================================================================
+# DATA HELPERS
+# =============================================================================
+
+# Shared generator for all simulated chart data
+RNG = np.random.default_rng()
+
+
+def lttb_downsample(xs, ys, n_out):
+    """Downsample a series to n_out points with Largest-Triangle-Three-Buckets.
+    
+    The first and last points are always kept; each bucket in between keeps
+    the point forming the largest triangle with the previously kept point and
+    the average of the next bucket, which preserves the visual shape.
+    """
+    n = len(xs)
+    if n_out >= n or n_out < 3:
+        return xs, ys
+    
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    
+    # Bucket boundaries for the interior points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    
+    selected = np.empty(n_out, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        
+        # Average of the next bucket acts as the third triangle vertex
+        avg_x = xs[end:next_end].mean()
+        avg_y = ys[end:next_end].mean()
+        
+        # Doubled triangle areas for every candidate in this bucket
+        areas = np.abs(
+            (xs[a] - avg_x) * (ys[start:end] - ys[a])
+            - (xs[a] - xs[start:end]) * (avg_y - ys[a])
+        )
+        a = start + int(np.argmax(areas))
+        selected[i + 1] = a
+    
+    return xs[selected], ys[selected]
+
 
 # =============================================================================
 # INTERACTIVE CHART WIDGETS
@@ -31,7 +78,9 @@ def __init__(self, parent, title="Interactive Chart", **kwargs):
         self.canvas = None
         self.toolbar = None
         self.is_updating = False
+        self.animation = None
         self.create_widgets()
+        self.bind("<Destroy>", self.on_destroy)
     
     def create_widgets(self):
         """Create the interactive chart widget interface"""
@@ -76,13 +125,24 @@ def toggle_pause(self):
         """Toggle chart updates on/off"""
         self.is_updating = not self.is_updating
         if self.is_updating:
+            if self.animation is not None:
+                self.animation.resume()
+                # Repaint without the now-animated artists so blitting starts clean
+                self.canvas.draw_idle()
             self.pause_btn.config(text="Pause")
         else:
+            if self.animation is not None:
+                self.animation.pause()
             self.pause_btn.config(text="Resume")
     
     def clear_data(self):
         """Clear chart data - to be implemented by subclasses"""
         pass
+    
+    def on_destroy(self, event):
+        """Stop the animation timer when the widget is destroyed"""
+        if event.widget is self and self.animation is not None:
+            self.animation.event_source.stop()
 
 
 class RealTimeLineChart(InteractiveChartWidget):
@@ -96,7 +156,12 @@ def __init__(self, parent, **kwargs):
         self.update_interval = 1000  # milliseconds
         self.start_time = datetime.now()
         self.is_updating = True
-        self.start_data_thread()
+        
+        # Random steps are drawn in batches and consumed one per tick
+        self.step_batch = np.empty(0)
+        self.step_index = 0
+        
+        self.start_updates()
     
     def create_chart(self):
         """Create the real-time line chart"""
@@ -106,7 +171,7 @@ def create_chart(self):
         
         # Initial data
         self.data_x = [0]
-        self.data_y = [random.randint(20, 80)]
+        self.data_y = [int(RNG.integers(20, 81))]
         
         # Create the line plot
         self.line, = self.ax.plot(self.data_x, self.data_y, 'b-', linewidth=2, marker='o', markersize=4)
@@ -116,6 +181,7 @@ def create_chart(self):
         self.ax.set_xlabel("Time (seconds)", fontsize=12)
         self.ax.set_ylabel("Value", fontsize=12)
         self.ax.grid(True, alpha=0.3)
+        self.ax.set_xlim(0, 32)
         self.ax.set_ylim(0, 100)
         
         # Add horizontal lines for thresholds
@@ -128,11 +194,27 @@ def create_chart(self):
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
         
+        # Never render more vertices than the axes are wide in pixels
+        self.max_rendered_points = max(3, int(self.ax.bbox.width))
+        
         # Add navigation toolbar
         self.toolbar = NavigationToolbar2Tk(self.canvas, self)
         self.toolbar.update()
         
+        # Cursor coordinates, refreshed at most every 50 ms
+        self.coord_label = tk.Label(
+            self,
+            text="",
+            font=("Arial", 10),
+            fg="#7F8C8D",
+            anchor="w"
+        )
+        self.coord_label.pack(fill="x", padx=5, pady=(0, 5))
+        self.motion_after_id = None
+        self.motion_position = None
+        
         # Bind mouse events
+        self.canvas.mpl_connect('resize_event', self.on_resize)
         self.canvas.mpl_connect('motion_notify_event', self.on_mouse_move)
         self.canvas.mpl_connect('button_press_event', self.on_click)
     
@@ -154,32 +236,68 @@ def add_data_point(self, value):
             self.data_x.pop(0)
             self.data_y.pop(0)
         
-        # Update the line data
-        self.line.set_data(self.data_x, self.data_y)
-        
-        # Adjust x-axis limits for scrolling effect
-        if len(self.data_x) > 1:
-            x_min = max(0, self.data_x[-1] - 30)  # Show last 30 seconds
-            x_max = self.data_x[-1] + 2
-            self.ax.set_xlim(x_min, x_max)
-        
-        # Redraw the canvas
-        self.canvas.draw()
+        self.render()
+    
+    def get_render_data(self):
+        """Return the series to draw, downsampled when there are more points than pixels"""
+        if len(self.data_x) > self.max_rendered_points:
+            return lttb_downsample(self.data_x, self.data_y, self.max_rendered_points)
+        return self.data_x, self.data_y
+    
+    def render(self):
+        """Push the buffered data to the line, paging the x-axis when it fills up
+        
+        The line itself is drawn by the blitting animation. The x-axis jumps
+        forward by a page instead of scrolling every tick, so the static
+        background only needs a full redraw every few seconds.
+        """
+        self.line.set_data(*self.get_render_data())
+        
+        latest = self.data_x[-1] if self.data_x else 0
+        x_min, x_max = self.ax.get_xlim()
+        if not x_min <= latest <= x_max:
+            page_start = max(0, latest - 20)
+            self.ax.set_xlim(page_start, page_start + 32)
+            self.canvas.draw()
+        elif not self.is_updating:
+            # Paused: nothing is blitting, so draw the figure directly
+            self.canvas.draw_idle()
     
     def clear_data(self):
         """Clear all data from the chart"""
         self.data_x = [0]
-        self.data_y = [random.randint(20, 80)]
+        self.data_y = [int(RNG.integers(20, 81))]
         self.start_time = datetime.now()
-        self.line.set_data(self.data_x, self.data_y)
-        self.ax.set_xlim(0, 10)
-        self.canvas.draw()
+        self.render()
+    
+    def on_resize(self, event):
+        """Recompute the rendered point budget when the canvas is resized"""
+        self.max_rendered_points = max(3, int(self.ax.bbox.width))
     
     def on_mouse_move(self, event):
         """Handle mouse movement over the chart"""
-        if event.inaxes:
-            # Update status bar or tooltip with coordinates
-            pass
+        # Remember the latest position; a pending flush will pick it up
+        self.motion_position = (event.xdata, event.ydata) if event.inaxes else None
+        if self.motion_after_id is not None:
+            return
+        
+        self.motion_after_id = self.after(50, self.flush_mouse_move)
+    
+    def flush_mouse_move(self):
+        """Show the most recent cursor position once per throttle interval"""
+        self.motion_after_id = None
+        if self.motion_position is None:
+            self.coord_label.config(text="")
+        else:
+            x, y = self.motion_position
+            self.coord_label.config(text=f"Time: {x:.1f}s   Value: {y:.1f}")
+    
+    def on_destroy(self, event):
+        """Stop the animation and cancel a pending cursor update when the widget is destroyed"""
+        super().on_destroy(event)
+        if event.widget is self and self.motion_after_id is not None:
+            self.after_cancel(self.motion_after_id)
+            self.motion_after_id = None
     
     def on_click(self, event):
         """Handle mouse clicks on the chart"""
@@ -188,40 +306,151 @@ def on_click(self, event):
             if event.ydata is not None:
                 self.add_data_point(event.ydata)
     
-    def start_data_thread(self):
-        """Start the data generation thread"""
-        def generate_data():
-            while True:
-                if self.is_updating:
-                    # Generate realistic data with some trend
-                    if len(self.data_y) > 0:
-                        last_value = self.data_y[-1]
-                        # Add some trend and noise
-                        trend = random.uniform(-2, 2)
-                        noise = random.uniform(-5, 5)
-                        new_value = max(0, min(100, last_value + trend + noise))
-                    else:
-                        new_value = random.randint(20, 80)
-                    
-                    # Use after() to update from main thread
-                    self.after(0, self.add_data_point, new_value)
-                
-                time.sleep(self.update_interval / 1000)
-        
-        # Start thread
-        thread = threading.Thread(target=generate_data, daemon=True)
-        thread.start()
+    def next_value(self):
+        """Generate the next simulated reading"""
+        # Generate realistic data with some trend
+        if len(self.data_y) > 0:
+            if self.step_index >= len(self.step_batch):
+                # Pre-generate the next 1024 steps of trend plus noise
+                self.step_batch = RNG.uniform(-2, 2, 1024) + RNG.uniform(-5, 5, 1024)
+                self.step_index = 0
+            step = self.step_batch[self.step_index]
+            self.step_index += 1
+            return max(0, min(100, self.data_y[-1] + step))
+        return int(RNG.integers(20, 81))
+    
+    def animate(self, frame):
+        """Animation callback: add a reading and return the artists to blit"""
+        self.add_data_point(self.next_value())
+        return (self.line,)
+    
+    def start_updates(self):
+        """Drive the chart with a blitting FuncAnimation on the Tk event loop"""
+        self.animation = FuncAnimation(
+            self.figure,
+            self.animate,
+            init_func=lambda: (self.line,),
+            interval=self.update_interval,
+            blit=True,
+            cache_frame_data=False
+        )
+
+
+class TkCanvasLineChart(RealTimeLineChart):
+    """Real-time line chart drawn natively on a tk.Canvas
+    
+    Each update moves the coordinates of a single canvas line item instead
+    of re-rendering a Matplotlib figure through Agg.
+    """
+    
+    def create_chart(self):
+        """Create the canvas, threshold lines and data line"""
+        # Initial data
+        self.data_x = [0]
+        self.data_y = [int(RNG.integers(20, 81))]
+        
+        # Size is unknown until the canvas is mapped
+        self.plot_width = 1
+        self.plot_height = 1
+        self.max_rendered_points = 3
+        
+        self.canvas = tk.Canvas(self, bg="white", highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True, padx=5, pady=5)
+        
+        # Threshold lines, positioned on resize
+        self.high_line = self.canvas.create_line(0, 0, 0, 0, fill="red", dash=(4, 4))
+        self.low_line = self.canvas.create_line(0, 0, 0, 0, fill="orange", dash=(4, 4))
+        
+        # Data line, updated in place on every tick
+        self.line_id = self.canvas.create_line(0, 0, 0, 0, fill="blue", width=2)
+        
+        # Bind canvas events
+        self.canvas.bind("<Configure>", self.on_resize)
+        self.canvas.bind("<Button-1>", self.on_click)
+        
+        self.after_id = None
+    
+    def start_updates(self):
+        """Schedule the next tick on the Tk event loop"""
+        self.after_id = self.after(self.update_interval, self.tick)
+    
+    def tick(self):
+        """Add a reading and schedule the next one"""
+        self.add_data_point(self.next_value())
+        self.start_updates()
+    
+    def toggle_pause(self):
+        """Toggle chart updates, cancelling the pending tick while paused"""
+        super().toggle_pause()
+        if self.is_updating:
+            self.start_updates()
+        elif self.after_id is not None:
+            self.after_cancel(self.after_id)
+            self.after_id = None
+    
+    def on_destroy(self, event):
+        """Cancel the pending tick when the widget is destroyed"""
+        if event.widget is self and self.after_id is not None:
+            self.after_cancel(self.after_id)
+            self.after_id = None
+    
+    def get_x_window(self):
+        """Return the visible time range, scrolling to show the last 30 seconds"""
+        if len(self.data_x) > 1:
+            return max(0, self.data_x[-1] - 30), self.data_x[-1] + 2
+        return 0, 10
+    
+    def value_to_y(self, value):
+        """Convert a 0-100 value to a canvas y coordinate"""
+        return self.plot_height - value * self.plot_height / 100
+    
+    def render(self):
+        """Move the data line to the current buffer contents"""
+        xs, ys = self.get_render_data()
+        if len(xs) == 0 or self.plot_width <= 1:
+            return
+        
+        # Scale data coordinates to canvas pixels in one vectorized pass
+        x_min, x_max = self.get_x_window()
+        px = (np.asarray(xs, dtype=float) - x_min) * (self.plot_width / (x_max - x_min))
+        py = self.plot_height - np.asarray(ys, dtype=float) * (self.plot_height / 100)
+        coords = np.column_stack((px, py)).ravel().tolist()
+        
+        # A canvas line needs at least two points
+        if len(coords) < 4:
+            coords *= 2
+        self.canvas.coords(self.line_id, *coords)
+    
+    def on_resize(self, event):
+        """Rescale the chart to the new canvas size"""
+        self.plot_width = event.width
+        self.plot_height = event.height
+        self.max_rendered_points = max(3, event.width)
+        
+        for line_id, value in ((self.high_line, 80), (self.low_line, 20)):
+            y = self.value_to_y(value)
+            self.canvas.coords(line_id, 0, y, event.width, y)
+        
+        self.render()
+    
+    def on_click(self, event):
+        """Add a manual data point at the clicked height"""
+        if self.plot_height > 1:
+            value = (self.plot_height - event.y) * 100 / self.plot_height
+            self.add_data_point(max(0, min(100, value)))
 
 
 class InteractiveBarChart(InteractiveChartWidget):
     """Interactive bar chart with clickable bars"""
     
     def __init__(self, parent, **kwargs):
-        super().__init__(parent, title="Interactive Bar Chart", **kwargs)
+        # Chart data must exist before the base class calls create_chart()
         self.categories = ['Category A', 'Category B', 'Category C', 'Category D', 'Category E']
-        self.values = [random.randint(10, 90) for _ in range(5)]
+        self.values = RNG.integers(10, 91, 5).tolist()
         self.colors = ['#3498DB', '#E74C3C', '#2ECC71', '#F39C12', '#9B59B6']
         self.selected_bar = None
+        self.background = None
+        super().__init__(parent, title="Interactive Bar Chart", **kwargs)
     
     def create_chart(self):
         """Create the interactive bar chart"""
@@ -229,17 +458,24 @@ def create_chart(self):
         self.figure = Figure(figsize=(8, 5), dpi=100)
         self.ax = self.figure.add_subplot(111)
         
-        # Create the bar plot
+        # Create the bar plot; bars and labels are animated so clicks can be blitted
         self.bars = self.ax.bar(self.categories, self.values, color=self.colors, alpha=0.7)
+        for bar in self.bars:
+            bar.set_animated(True)
         
         # Add value labels on bars
         self.value_labels = []
         for bar, value in zip(self.bars, self.values):
             height = bar.get_height()
             label = self.ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-                               f'{value}', ha='center', va='bottom', fontweight='bold')
+                               f'{value}', ha='center', va='bottom', fontweight='bold',
+                               animated=True)
             self.value_labels.append(label)
         
+        # Bar geometry for direct hit-testing from click coordinates
+        self.bar_centers = np.array([bar.get_x() + bar.get_width() / 2 for bar in self.bars])
+        self.bar_half_width = self.bars[0].get_width() / 2
+        
         # Customize the chart
         self.ax.set_title("Interactive Bar Chart (Click bars to update)", fontsize=14, fontweight='bold')
         self.ax.set_xlabel("Categories", fontsize=12)
@@ -249,6 +485,9 @@ def create_chart(self):
         
         # Create canvas and toolbar
         self.canvas = FigureCanvasTkAgg(self.figure, self)
+        
+        # Re-cache the static background after every full draw (first draw, resize, zoom)
+        self.canvas.mpl_connect('draw_event', self.on_draw)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
         
@@ -256,39 +495,76 @@ def create_chart(self):
         self.toolbar = NavigationToolbar2Tk(self.canvas, self)
         self.toolbar.update()
         
+        # Status line (non-blocking replacement for a message box)
+        self.status_label = tk.Label(
+            self,
+            text="Click a bar to update its value",
+            font=("Arial", 10),
+            fg="#7F8C8D",
+            anchor="w"
+        )
+        self.status_label.pack(fill="x", padx=5, pady=(0, 5))
+        
         # Bind click events
         self.canvas.mpl_connect('button_press_event', self.on_bar_click)
     
+    def on_draw(self, event):
+        """Cache the background and paint the animated artists after a full draw"""
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.draw_animated()
+    
+    def draw_animated(self):
+        """Draw the animated bars and value labels onto the canvas"""
+        for artist in (*self.bars, *self.value_labels):
+            self.ax.draw_artist(artist)
+    
+    def blit(self):
+        """Redraw only the animated artists on top of the cached background"""
+        if self.background is None:
+            self.canvas.draw()
+            return
+        
+        self.canvas.restore_region(self.background)
+        self.draw_animated()
+        self.canvas.blit(self.ax.bbox)
+    
     def on_bar_click(self, event):
         """Handle clicks on bars"""
-        if event.inaxes:
-            for i, bar in enumerate(self.bars):
-                if bar.contains(event)[0]:
-                    # Update the clicked bar
-                    new_value = random.randint(10, 90)
-                    self.values[i] = new_value
-                    bar.set_height(new_value)
-                    
-                    # Update the value label
-                    self.value_labels[i].set_text(f'{new_value}')
-                    self.value_labels[i].set_position((bar.get_x() + bar.get_width()/2., new_value + 1))
-                    
-                    # Highlight the selected bar
-                    if self.selected_bar:
-                        self.selected_bar.set_alpha(0.7)
-                    bar.set_alpha(1.0)
-                    self.selected_bar = bar
-                    
-                    # Redraw the canvas
-                    self.canvas.draw()
-                    
-                    # Show message
-                    messagebox.showinfo("Bar Updated", f"{self.categories[i]}: {new_value}")
-                    break
+        if event.inaxes is not self.ax or event.xdata is None or event.ydata is None:
+            return
+        
+        # Find the nearest bar from the click position instead of testing each bar
+        i = int(np.argmin(np.abs(self.bar_centers - event.xdata)))
+        if abs(self.bar_centers[i] - event.xdata) > self.bar_half_width:
+            return
+        if not 0 <= event.ydata <= self.values[i]:
+            return
+        
+        # Update the clicked bar
+        bar = self.bars[i]
+        new_value = int(RNG.integers(10, 91))
+        self.values[i] = new_value
+        bar.set_height(new_value)
+        
+        # Update the value label
+        self.value_labels[i].set_text(f'{new_value}')
+        self.value_labels[i].set_y(new_value + 1)
+        
+        # Highlight the selected bar
+        if self.selected_bar:
+            self.selected_bar.set_alpha(0.7)
+        bar.set_alpha(1.0)
+        self.selected_bar = bar
+        
+        # Blit the changed artists instead of redrawing the figure
+        self.blit()
+        
+        # Report the change without blocking the event loop
+        self.status_label.config(text=f"Bar updated - {self.categories[i]}: {new_value}")
     
     def clear_data(self):
         """Clear and reset the bar chart data"""
-        self.values = [random.randint(10, 90) for _ in range(5)]
+        self.values = RNG.integers(10, 91, 5).tolist()
         
         # Update bars
         for bar, value in zip(self.bars, self.values):
@@ -297,44 +573,49 @@ def clear_data(self):
         # Update labels
         for label, value in zip(self.value_labels, self.values):
             label.set_text(f'{value}')
-            label.set_position((label.get_position()[0], value + 1))
+            label.set_y(value + 1)
         
         # Reset alpha
         for bar in self.bars:
             bar.set_alpha(0.7)
         self.selected_bar = None
         
-        self.canvas.draw()
+        self.blit()
+        self.status_label.config(text="Click a bar to update its value")
 
 
 class DynamicPieChart(InteractiveChartWidget):
     """Dynamic pie chart with animated updates"""
     
     def __init__(self, parent, **kwargs):
-        super().__init__(parent, title="Dynamic Pie Chart", **kwargs)
+        # Chart data must exist before the base class calls create_chart()
         self.labels = ['Sales', 'Marketing', 'Development', 'Support', 'Other']
         self.values = [30, 25, 20, 15, 10]
         self.colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7']
+        self.explode = 0.05
         self.wedges = None
         self.autotexts = None
+        super().__init__(parent, title="Dynamic Pie Chart", **kwargs)
         self.is_updating = True
         self.start_animation()
     
     def create_chart(self):
         """Create the dynamic pie chart"""
-        # Create figure and axes
+        # Create figure and axes, leaving room on the right for the legend
         self.figure = Figure(figsize=(8, 5), dpi=100)
         self.ax = self.figure.add_subplot(111)
+        self.figure.subplots_adjust(right=0.7)
         
-        # Create the pie chart
+        # Create the pie chart; category names go in a static legend so that
+        # only the wedges and percentages change between frames
         self.wedges, texts, self.autotexts = self.ax.pie(
             self.values, 
-            labels=self.labels, 
             autopct='%1.1f%%',
             colors=self.colors,
             startangle=90,
-            explode=(0.05, 0.05, 0.05, 0.05, 0.05)
+            explode=[self.explode] * len(self.values)
         )
+        self.ax.legend(self.wedges, self.labels, loc="center left", bbox_to_anchor=(1, 0.5))
         
         # Customize text
         for autotext in self.autotexts:
@@ -353,61 +634,64 @@ def create_chart(self):
         self.toolbar = NavigationToolbar2Tk(self.canvas, self)
         self.toolbar.update()
     
-    def update_values(self):
+    def update_wedges(self):
+        """Move the existing wedges and percentage labels to the current values"""
+        fractions = np.asarray(self.values, dtype=float) / sum(self.values)
+        
+        # Same geometry as Axes.pie: counter-clockwise from startangle=90
+        theta2 = 90 + 360 * np.cumsum(fractions)
+        theta1 = theta2 - 360 * fractions
+        middle = np.deg2rad((theta1 + theta2) / 2)
+        
+        for wedge, autotext, start, end, angle, fraction in zip(
+            self.wedges, self.autotexts, theta1, theta2, middle, fractions
+        ):
+            center_x = self.explode * np.cos(angle)
+            center_y = self.explode * np.sin(angle)
+            wedge.set_center((center_x, center_y))
+            wedge.set_theta1(start)
+            wedge.set_theta2(end)
+            
+            autotext.set_position((center_x + 0.6 * np.cos(angle), center_y + 0.6 * np.sin(angle)))
+            autotext.set_text(f'{fraction * 100:.1f}%')
+    
+    def update_values(self, frame=None):
         """Update pie chart values with animation"""
-        if not self.is_updating:
-            return
-        
-        # Generate new values
-        new_values = []
-        for i in range(len(self.values)):
-            # Add some randomness to current values
-            change = random.uniform(-5, 5)
-            new_value = max(5, min(40, self.values[i] + change))
-            new_values.append(new_value)
-        
-        # Normalize to sum to 100
-        total = sum(new_values)
-        self.values = [int(v * 100 / total) for v in new_values]
-        
-        # Update the pie chart
-        self.ax.clear()
-        self.wedges, texts, self.autotexts = self.ax.pie(
-            self.values, 
-            labels=self.labels, 
-            autopct='%1.1f%%',
-            colors=self.colors,
-            startangle=90,
-            explode=(0.05, 0.05, 0.05, 0.05, 0.05)
-        )
-        
-        # Customize text
-        for autotext in self.autotexts:
-            autotext.set_color('white')
-            autotext.set_fontweight('bold')
-        
-        # Customize the chart
-        self.ax.set_title("Dynamic Pie Chart", fontsize=14, fontweight='bold')
-        
-        # Redraw the canvas
-        self.canvas.draw()
+        if self.is_updating:
+            # Add some randomness to current values, all in one draw
+            changes = RNG.uniform(-5, 5, len(self.values))
+            new_values = np.clip(np.asarray(self.values) + changes, 5, 40)
+            
+            # Normalize to sum to 100
+            self.values = (new_values * 100 / new_values.sum()).astype(int).tolist()
+            
+            # Update the existing artists in place
+            self.update_wedges()
+        
+        return (*self.wedges, *self.autotexts)
     
     def clear_data(self):
         """Reset pie chart to initial values"""
         self.values = [30, 25, 20, 15, 10]
-        self.update_values()
+        self.update_wedges()
+        
+        # Redraw outside of an animation frame: repaint the background,
+        # then the animated artists on top of it
+        self.canvas.draw()
+        for artist in (*self.wedges, *self.autotexts):
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.ax.bbox)
     
     def start_animation(self):
         """Start the animation loop"""
-        def animate():
-            while True:
-                if self.is_updating:
-                    self.after(0, self.update_values)
-                time.sleep(3)  # Update every 3 seconds
-        
-        # Start animation thread
-        thread = threading.Thread(target=animate, daemon=True)
-        thread.start()
+        self.animation = FuncAnimation(
+            self.figure,
+            self.update_values,
+            init_func=lambda: (*self.wedges, *self.autotexts),
+            interval=3000,  # Update every 3 seconds
+            blit=True,
+            cache_frame_data=False
+        )
 
 
 # =============================================================================
@@ -417,11 +701,14 @@ def animate():
 class InteractiveChartsDemo:
     """Demo application showcasing interactive charts"""
     
-    def __init__(self, root):
+    def __init__(self, root, use_matplotlib_line=False):
         self.root = root
         self.root.title("Interactive Charts Demo")
         self.root.geometry("1400x900")
         
+        # The native Tk line chart is the default; Matplotlib is kept as an option
+        self.use_matplotlib_line = use_matplotlib_line
+        
         self.create_widgets()
     
     def create_widgets(self):
@@ -458,7 +745,8 @@ def create_widgets(self):
         top_frame = tk.Frame(charts_frame, bg="#ECF0F1")
         top_frame.pack(fill="both", expand=True, pady=(0, 10))
         
-        self.realtime_chart = RealTimeLineChart(top_frame)
+        line_chart_class = RealTimeLineChart if self.use_matplotlib_line else TkCanvasLineChart
+        self.realtime_chart = line_chart_class(top_frame)
         self.realtime_chart.pack(fill="both", expand=True)
         
         # Bottom row - Bar and Pie charts
@@ -10,6 +10,8 @@
 from tkinter import ttk, messagebox
 import re
 import json
+import unicodedata
+from functools import lru_cache, partial
 from datetime import datetime
 
 # =============================================================================
@@ -48,6 +50,8 @@ def validate(self, value):
 class EmailValidator(Validator):
     """Validator for email addresses"""
     
+    PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', re.ASCII)
+    
     def __init__(self, error_message="Invalid email address"):
         super().__init__(error_message)
     
@@ -55,14 +59,15 @@ def validate(self, value):
         if not value:
             return True, None  # Allow empty if not required
         
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, value):
+        if not self.PATTERN.match(value):
             return False, self.error_message
         return True, None
 
 class PhoneValidator(Validator):
     """Validator for phone numbers"""
     
+    NON_DIGITS = re.compile(r'\D', re.ASCII)
+    
     def __init__(self, error_message="Invalid phone number"):
         super().__init__(error_message)
     
@@ -71,7 +76,7 @@ def validate(self, value):
             return True, None  # Allow empty if not required
         
         # Remove all non-digit characters
-        digits_only = re.sub(r'\D', '', value)
+        digits_only = self.NON_DIGITS.sub('', value)
         if len(digits_only) < 10:
             return False, self.error_message
         return True, None
@@ -81,7 +86,7 @@ def format(self, value):
         if not value:
             return value
         
-        digits_only = re.sub(r'\D', '', value)
+        digits_only = self.NON_DIGITS.sub('', value)
         if len(digits_only) >= 10:
             return f"({digits_only[:3]}) {digits_only[3:6]}-{digits_only[6:10]}"
         return value
@@ -108,6 +113,13 @@ def validate(self, value):
         except ValueError:
             return False, self.error_message
 
+# Validators hold no per-field state, so the form shares one instance of each
+REQUIRED_VALIDATOR = RequiredValidator()
+EMAIL_VALIDATOR = EmailValidator()
+PHONE_VALIDATOR = PhoneValidator()
+AGE_VALIDATOR = NumberValidator(min_value=0, max_value=120)
+EMPLOYEE_COUNT_VALIDATOR = NumberValidator(min_value=1, max_value=100000)
+
 # =============================================================================
 # ADVANCED FORM WIDGETS
 # =============================================================================
@@ -120,6 +132,8 @@ def __init__(self, parent, label="", validators=None, **kwargs):
         self.label = label
         self.validators = validators or []
         self.error_label = None
+        self.has_error = False
+        self.last_validated = (None, (True, None))  # (value, (is_valid, error_message))
         self.create_widgets()
     
     def create_widgets(self):
@@ -130,22 +144,14 @@ def create_widgets(self):
             label_widget.pack(fill="x", pady=(0, 2))
         
         # Entry frame
-        entry_frame = tk.Frame(self)
-        entry_frame.pack(fill="x")
+        self.entry_frame = tk.Frame(self)
+        self.entry_frame.pack(fill="x")
         
         # Entry widget
-        self.entry = tk.Entry(entry_frame)
+        self.entry = tk.Entry(self.entry_frame)
         self.entry.pack(side="left", fill="x", expand=True)
         
-        # Error label (initially hidden)
-        self.error_label = tk.Label(
-            entry_frame,
-            text="",
-            fg="red",
-            font=("Arial", 8),
-            anchor="w"
-        )
-        self.error_label.pack(side="right", padx=(5, 0))
+        # The error label is created on the first error (see show_error)
         
         # Bind validation events
         self.entry.bind("<FocusOut>", self.validate_on_focus_out)
@@ -157,6 +163,9 @@ def get_value(self):
     
     def set_value(self, value):
         """Set the current value"""
+        if not value and not self.entry.get():
+            return  # Already empty; skip the delete/insert round-trips
+        
         self.entry.delete(0, tk.END)
         self.entry.insert(0, value)
     
@@ -164,11 +173,20 @@ def validate(self):
         """Validate the current value"""
         value = self.get_value()
         
-        for validator in self.validators:
-            is_valid, error_message = validator.validate(value)
-            if not is_valid:
-                self.show_error(error_message)
-                return False
+        # Reuse the last result when the value hasn't changed since
+        if value == self.last_validated[0]:
+            is_valid, error_message = self.last_validated[1]
+        else:
+            is_valid, error_message = True, None
+            for validator in self.validators:
+                is_valid, error_message = validator.validate(value)
+                if not is_valid:
+                    break
+            self.last_validated = (value, (is_valid, error_message))
+        
+        if not is_valid:
+            self.show_error(error_message)
+            return False
         
         self.clear_error()
         return True
@@ -180,28 +198,51 @@ def validate_on_focus_out(self, event=None):
     def validate_on_key_release(self, event=None):
         """Validate on key release (for real-time validation)"""
         # Only clear error on key release, don't show new errors
-        if self.error_label.cget("text"):
+        if self.has_error:
             self.clear_error()
     
     def show_error(self, message):
         """Show error message"""
+        if self.error_label is None:
+            self.error_label = tk.Label(
+                self.entry_frame,
+                text="",
+                fg="red",
+                font=("Arial", 8),
+                anchor="w"
+            )
+            self.error_label.pack(side="right", padx=(5, 0))
+        
         self.error_label.configure(text=message)
         self.entry.configure(bg="#FFE6E6")  # Light red background
+        self.has_error = True
     
     def clear_error(self):
         """Clear error message"""
-        self.error_label.configure(text="")
+        if self.error_label is not None:
+            self.error_label.configure(text="")
         self.entry.configure(bg="white")
+        self.has_error = False
 
 class AutoCompleteEntry(tk.Frame):
     """Entry widget with auto-complete functionality"""
     
+    MAX_SUGGESTIONS = 5
+    TRIE_MATCHES = "matches"  # Multi-character key, so it never clashes with a letter
+    FILTER_DELAY = 100  # ms of typing pause before the suggestions are filtered
+    FILTER_CACHE_SIZE = 128
+    
     def __init__(self, parent, label="", suggestions=None, **kwargs):
         super().__init__(parent, **kwargs)
         self.label = label
-        self.suggestions = suggestions or []
+        self.filter_after_id = None
+        self.hide_after_id = None
+        self.set_suggestions(suggestions or [])
         self.filtered_suggestions = []
         self.listbox = None
+        self.listbox_visible = False
+        self.last_shown = []
+        self.setting_value = False
         self.create_widgets()
     
     def create_widgets(self):
@@ -215,41 +256,101 @@ def create_widgets(self):
         entry_frame = tk.Frame(self)
         entry_frame.pack(fill="x")
         
-        # Entry widget
-        self.entry = tk.Entry(entry_frame)
+        # Entry widget; the variable trace fires only when the text changes
+        self.text_var = tk.StringVar()
+        self.text_var.trace_add("write", self.on_text_change)
+        self.entry = tk.Entry(entry_frame, textvariable=self.text_var)
         self.entry.pack(side="left", fill="x", expand=True)
         
-        # Bind events
-        self.entry.bind("<KeyRelease>", self.on_key_release)
+        # Suggestion listbox, created once and packed only while it has items
+        self.listbox = tk.Listbox(
+            self,
+            height=self.MAX_SUGGESTIONS,
+            bg="white",
+            relief="solid",
+            borderwidth=1
+        )
+        self.listbox.bind("<Button-1>", self.on_suggestion_select)
+        
+        # Bind events: navigation runs on key press so holding an arrow key
+        # auto-repeats through the list
+        self.entry.bind("<FocusIn>", self.on_focus_in)
         self.entry.bind("<FocusOut>", self.on_focus_out)
-        self.entry.bind("<Down>", self.on_down)
-        self.entry.bind("<Up>", self.on_up)
-        self.entry.bind("<Return>", self.on_return)
+        self.entry.bind("<KeyPress-Down>", self.on_down)
+        self.entry.bind("<KeyPress-Up>", self.on_up)
+        self.entry.bind("<KeyPress-Return>", self.on_return)
     
     def get_value(self):
         """Get the current value"""
-        return self.entry.get()
+        return self.text_var.get()
     
     def set_value(self, value):
-        """Set the current value"""
-        self.entry.delete(0, tk.END)
-        self.entry.insert(0, value)
+        """Set the current value without triggering suggestion filtering"""
+        if self.filter_after_id is not None:
+            self.after_cancel(self.filter_after_id)
+            self.filter_after_id = None
+        
+        self.setting_value = True
+        try:
+            self.text_var.set(value)
+        finally:
+            self.setting_value = False
     
     def set_suggestions(self, suggestions):
-        """Set the suggestion list"""
-        self.suggestions = suggestions
-    
-    def on_key_release(self, event):
-        """Handle key release events"""
-        if event.keysym in ['Down', 'Up', 'Return']:
+        """Set the suggestion list and build its prefix trie"""
+        self.suggestions = tuple(suggestions)
+        
+        # Memoize lookups per suggestion list; a new list gets a fresh cache
+        self.cached_match_indices = lru_cache(maxsize=self.FILTER_CACHE_SIZE)(self.match_indices)
+        
+        # Every trie node stores the first few matches for its prefix, in list
+        # order, so a lookup only walks the typed characters
+        self.trie = {}
+        for index, suggestion in enumerate(self.suggestions):
+            node = self.trie
+            for char in self.normalize(suggestion):
+                node = node.setdefault(char, {})
+                matches = node.setdefault(self.TRIE_MATCHES, [])
+                if len(matches) < self.MAX_SUGGESTIONS:
+                    matches.append(index)
+    
+    @staticmethod
+    def normalize(text):
+        """Fold case and strip accents so that cafe matches Café"""
+        decomposed = unicodedata.normalize("NFKD", text)
+        return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+    
+    def match_indices(self, key):
+        """Return the indices of the suggestions starting with a normalized key"""
+        node = self.trie
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                return ()
+        return tuple(node.get(self.TRIE_MATCHES, ()))
+    
+    def find_matches(self, prefix):
+        """Return the suggestions starting with prefix (case and accent insensitive)"""
+        indices = self.cached_match_indices(self.normalize(prefix))
+        return [self.suggestions[index] for index in indices]
+    
+    def on_text_change(self, *args):
+        """Handle edits to the entry text"""
+        if self.setting_value:
             return
         
+        # Restart the timer so a burst of keystrokes is filtered only once
+        if self.filter_after_id is not None:
+            self.after_cancel(self.filter_after_id)
+        self.filter_after_id = self.after(self.FILTER_DELAY, self.filter_suggestions)
+    
+    def filter_suggestions(self):
+        """Filter the suggestions for the current entry text"""
+        self.filter_after_id = None
+        
         value = self.get_value()
         if value:
-            self.filtered_suggestions = [
-                suggestion for suggestion in self.suggestions
-                if suggestion.lower().startswith(value.lower())
-            ]
+            self.filtered_suggestions = self.find_matches(value)
             self.show_suggestions()
         else:
             self.hide_suggestions()
@@ -260,39 +361,59 @@ def show_suggestions(self):
             self.hide_suggestions()
             return
         
-        # Create listbox if it doesn't exist
-        if not self.listbox:
-            self.listbox = tk.Listbox(
-                self,
-                height=min(len(self.filtered_suggestions), 5),
-                bg="white",
-                relief="solid",
-                borderwidth=1
-            )
-            self.listbox.pack(fill="x", pady=(2, 0))
-        
-        # Update listbox content
-        self.listbox.delete(0, tk.END)
-        for suggestion in self.filtered_suggestions[:5]:  # Limit to 5 suggestions
-            self.listbox.insert(tk.END, suggestion)
+        # Nothing to do when the same suggestions are already on screen
+        shown = self.filtered_suggestions[:self.MAX_SUGGESTIONS]
+        if self.listbox_visible and shown == self.last_shown:
+            return
         
-        # Bind selection event
-        self.listbox.bind("<Button-1>", self.on_suggestion_select)
+        # Update listbox content, touching only the rows that changed
+        for index, suggestion in enumerate(shown):
+            if index < len(self.last_shown):
+                if self.last_shown[index] == suggestion:
+                    continue
+                self.listbox.delete(index)
+            self.listbox.insert(index, suggestion)
+        
+        if len(self.last_shown) > len(shown):
+            self.listbox.delete(len(shown), tk.END)
+        if len(self.last_shown) != len(shown):
+            self.listbox.configure(height=len(shown))
+        self.last_shown = shown
+        
+        if not self.listbox_visible:
+            self.listbox.pack(fill="x", pady=(2, 0))
+            self.listbox_visible = True
     
     def hide_suggestions(self):
         """Hide the suggestion listbox"""
-        if self.listbox:
-            self.listbox.destroy()
-            self.listbox = None
+        if self.listbox_visible:
+            self.listbox.pack_forget()
+            self.listbox_visible = False
+    
+    def on_focus_in(self, event):
+        """Handle focus in events"""
+        self.cancel_pending_hide()
     
     def on_focus_out(self, event):
         """Handle focus out events"""
         # Delay hiding to allow for listbox clicks
-        self.after(150, self.hide_suggestions)
+        self.cancel_pending_hide()
+        self.hide_after_id = self.after(150, self.hide_after_focus_out)
+    
+    def cancel_pending_hide(self):
+        """Cancel a hide scheduled by an earlier focus out"""
+        if self.hide_after_id is not None:
+            self.after_cancel(self.hide_after_id)
+            self.hide_after_id = None
+    
+    def hide_after_focus_out(self):
+        """Hide the suggestions once the focus-out delay has passed"""
+        self.hide_after_id = None
+        self.hide_suggestions()
     
     def on_down(self, event):
         """Handle down arrow key"""
-        if self.listbox and self.filtered_suggestions:
+        if self.listbox_visible and self.filtered_suggestions:
             current_selection = self.listbox.curselection()
             if current_selection:
                 next_index = (current_selection[0] + 1) % len(self.filtered_suggestions)
@@ -305,7 +426,7 @@ def on_down(self, event):
     
     def on_up(self, event):
         """Handle up arrow key"""
-        if self.listbox and self.filtered_suggestions:
+        if self.listbox_visible and self.filtered_suggestions:
             current_selection = self.listbox.curselection()
             if current_selection:
                 prev_index = (current_selection[0] - 1) % len(self.filtered_suggestions)
@@ -318,13 +439,13 @@ def on_up(self, event):
     
     def on_return(self, event):
         """Handle return key"""
-        if self.listbox and self.listbox.curselection():
+        if self.listbox_visible and self.listbox.curselection():
             self.on_suggestion_select(None)
         return "break"
     
     def on_suggestion_select(self, event):
         """Handle suggestion selection"""
-        if self.listbox and self.listbox.curselection():
+        if self.listbox_visible and self.listbox.curselection():
             selected_index = self.listbox.curselection()[0]
             selected_value = self.filtered_suggestions[selected_index]
             self.set_value(selected_value)
@@ -333,20 +454,24 @@ def on_suggestion_select(self, event):
 class DynamicForm(tk.Frame):
     """Dynamic form with conditional fields"""
     
+    FIELD_NAMES = ('name', 'email', 'phone', 'age')
+    
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
-        self.fields = {}
+        self.fields = []  # Basic field widgets, in FIELD_NAMES order
+        self.field_index = {name: index for index, name in enumerate(self.FIELD_NAMES)}
         self.conditional_fields = {}
+        self.conditional_widgets = {}  # User type -> list of its field widgets
+        self.current_user_type = None
         self.create_widgets()
     
     def create_widgets(self):
         """Create the dynamic form interface"""
         # Title
-        title_label = tk.Label(
+        title_label = ttk.Label(
             self,
             text="Dynamic Form with Conditional Fields",
-            font=("Arial", 14, "bold"),
-            fg="#2C3E50"
+            style="Title.TLabel"
         )
         title_label.pack(pady=20)
         
@@ -356,44 +481,75 @@ def create_widgets(self):
         
         # Create form fields
         self.create_form_fields()
+        
+        # Resolve each field's methods once for the validate/read/clear loops
+        self.field_table = [self.bind_field(name, field) for name, field in zip(self.FIELD_NAMES, self.fields)]
+        self.conditional_tables = {
+            user_type: [self.bind_field(name, field) for name, field in fields.items()]
+            for user_type, fields in self.conditional_fields.items()
+        }
+    
+    def get_field(self, name):
+        """Return the basic field widget with the given name"""
+        return self.fields[self.field_index[name]]
+    
+    def bind_field(self, name, field):
+        """Return (name, label, validate, get_value, clear) with the field's bound methods
+        
+        Missing capabilities are None, so the form loops test a local
+        instead of calling hasattr() on every pass.
+        """
+        validate = getattr(field, 'validate', None)
+        get_value = getattr(field, 'get_value', None) or getattr(field, 'get', None)
+        
+        if hasattr(field, 'set_value'):
+            clear = partial(field.set_value, "")
+        elif hasattr(field, 'delete'):
+            clear = partial(field.delete, 0, tk.END)
+        else:
+            clear = None
+        
+        return name, getattr(field, 'label', None) or name, validate, get_value, clear
     
     def create_form_fields(self):
         """Create the form fields"""
         # Basic information section
-        basic_frame = tk.LabelFrame(self.form_frame, text="Basic Information", font=("Arial", 12, "bold"))
+        basic_frame = ttk.LabelFrame(self.form_frame, text="Basic Information", style="Section.TLabelframe")
         basic_frame.pack(fill="x", pady=10)
         
         # Name field
-        self.fields['name'] = ValidatedEntry(
+        name_field = ValidatedEntry(
             basic_frame,
             label="Full Name *",
-            validators=[RequiredValidator()]
+            validators=[REQUIRED_VALIDATOR]
         )
-        self.fields['name'].pack(fill="x", padx=10, pady=5)
+        name_field.pack(fill="x", padx=10, pady=5)
         
         # Email field
-        self.fields['email'] = ValidatedEntry(
+        email_field = ValidatedEntry(
             basic_frame,
             label="Email Address",
-            validators=[EmailValidator()]
+            validators=[EMAIL_VALIDATOR]
         )
-        self.fields['email'].pack(fill="x", padx=10, pady=5)
+        email_field.pack(fill="x", padx=10, pady=5)
         
         # Phone field
-        self.fields['phone'] = ValidatedEntry(
+        phone_field = ValidatedEntry(
             basic_frame,
             label="Phone Number",
-            validators=[PhoneValidator()]
+            validators=[PHONE_VALIDATOR]
         )
-        self.fields['phone'].pack(fill="x", padx=10, pady=5)
+        phone_field.pack(fill="x", padx=10, pady=5)
         
         # Age field
-        self.fields['age'] = ValidatedEntry(
+        age_field = ValidatedEntry(
             basic_frame,
             label="Age",
-            validators=[NumberValidator(min_value=0, max_value=120)]
+            validators=[AGE_VALIDATOR]
         )
-        self.fields['age'].pack(fill="x", padx=10, pady=5)
+        age_field.pack(fill="x", padx=10, pady=5)
+        
+        self.fields = [name_field, email_field, phone_field, age_field]
         
         # User type selection
         user_type_frame = tk.Frame(basic_frame)
@@ -421,7 +577,7 @@ def create_form_fields(self):
         business_rb.pack(side="left", padx=5)
         
         # Conditional fields frame
-        self.conditional_frame = tk.LabelFrame(self.form_frame, text="Additional Information", font=("Arial", 12, "bold"))
+        self.conditional_frame = ttk.LabelFrame(self.form_frame, text="Additional Information", style="Section.TLabelframe")
         self.conditional_frame.pack(fill="x", pady=10)
         
         # Create conditional fields
@@ -483,7 +639,7 @@ def create_conditional_fields(self):
         self.conditional_fields['business']['company'] = ValidatedEntry(
             self.conditional_frame,
             label="Company Name *",
-            validators=[RequiredValidator()]
+            validators=[REQUIRED_VALIDATOR]
         )
         
         # Industry auto-complete
@@ -503,9 +659,15 @@ def create_conditional_fields(self):
         self.conditional_fields['business']['employees'] = ValidatedEntry(
             self.conditional_frame,
             label="Number of Employees",
-            validators=[NumberValidator(min_value=1, max_value=100000)]
+            validators=[EMPLOYEE_COUNT_VALIDATOR]
         )
         
+        # Flat widget lists so switching types doesn't walk the nested dicts
+        self.conditional_widgets = {
+            user_type: list(fields.values())
+            for user_type, fields in self.conditional_fields.items()
+        }
+        
         # Initially show individual fields
         self.show_conditional_fields("individual")
     
@@ -516,59 +678,51 @@ def on_user_type_change(self):
     
     def show_conditional_fields(self, user_type):
         """Show fields for the specified user type"""
-        # Hide all conditional fields
-        for fields in self.conditional_fields.values():
-            for field in fields.values():
-                field.pack_forget()
+        if user_type == self.current_user_type:
+            return
+        
+        # Hide only the group that is currently shown
+        for field in self.conditional_widgets.get(self.current_user_type, []):
+            field.pack_forget()
         
         # Show fields for the selected user type
-        if user_type in self.conditional_fields:
-            for field in self.conditional_fields[user_type].values():
-                field.pack(fill="x", padx=10, pady=5)
+        for field in self.conditional_widgets.get(user_type, []):
+            field.pack(fill="x", padx=10, pady=5)
+        
+        self.current_user_type = user_type
     
     def validate_form(self):
         """Validate all form fields"""
         errors = []
         
-        # Validate basic fields
-        for field_name, field in self.fields.items():
-            if hasattr(field, 'validate'):
-                if not field.validate():
-                    errors.append(f"{field.label or field_name}: validation failed")
-        
-        # Validate conditional fields
+        # Validate basic fields, then the visible conditional fields
         user_type = self.user_type_var.get()
-        if user_type in self.conditional_fields:
-            for field_name, field in self.conditional_fields[user_type].items():
-                if hasattr(field, 'validate'):
-                    if not field.validate():
-                        errors.append(f"{field.label or field_name}: validation failed")
+        for table in (self.field_table, self.conditional_tables.get(user_type, [])):
+            for field_name, label, validate, get_value, clear in table:
+                if validate is not None and not validate():
+                    errors.append(f"{label}: validation failed")
         
         return errors
     
     def get_form_data(self):
         """Get all form data as a dictionary"""
-        data = {
-            'user_type': self.user_type_var.get(),
-            'timestamp': datetime.now().isoformat()
-        }
+        # Create every key up front, in a fixed order
+        data = dict.fromkeys(('user_type', 'timestamp', *self.FIELD_NAMES))
+        data['user_type'] = self.user_type_var.get()
+        data['timestamp'] = datetime.now().isoformat()
         
         # Get basic field values
-        for field_name, field in self.fields.items():
-            if hasattr(field, 'get_value'):
-                data[field_name] = field.get_value()
-            elif hasattr(field, 'get'):
-                data[field_name] = field.get()
+        for field_name, label, validate, get_value, clear in self.field_table:
+            if get_value is not None:
+                data[field_name] = get_value()
         
         # Get conditional field values
         user_type = self.user_type_var.get()
-        if user_type in self.conditional_fields:
+        if user_type in self.conditional_tables:
             data[user_type] = {}
-            for field_name, field in self.conditional_fields[user_type].items():
-                if hasattr(field, 'get_value'):
-                    data[user_type][field_name] = field.get_value()
-                elif hasattr(field, 'get'):
-                    data[user_type][field_name] = field.get()
+            for field_name, label, validate, get_value, clear in self.conditional_tables[user_type]:
+                if get_value is not None:
+                    data[user_type][field_name] = get_value()
         
         return data
     
@@ -585,7 +739,7 @@ def submit_form(self):
         form_data = self.get_form_data()
         
         # Show success message with data
-        success_message = f"Form submitted successfully!\n\nData:\n{json.dumps(form_data, indent=2)}"
+        success_message = f"Form submitted successfully!\n\nData:\n{json.dumps(form_data, ensure_ascii=False, separators=(',', ': '), indent=2)}"
         messagebox.showinfo("Success", success_message)
         
         # Clear form after successful submission
@@ -594,19 +748,15 @@ def submit_form(self):
     def clear_form(self):
         """Clear all form fields"""
         # Clear basic fields
-        for field in self.fields.values():
-            if hasattr(field, 'set_value'):
-                field.set_value("")
-            elif hasattr(field, 'delete'):
-                field.delete(0, tk.END)
+        for field_name, label, validate, get_value, clear in self.field_table:
+            if clear is not None:
+                clear()
         
         # Clear conditional fields
-        for fields in self.conditional_fields.values():
-            for field in fields.values():
-                if hasattr(field, 'set_value'):
-                    field.set_value("")
-                elif hasattr(field, 'delete'):
-                    field.delete(0, tk.END)
+        for table in self.conditional_tables.values():
+            for field_name, label, validate, get_value, clear in table:
+                if clear is not None:
+                    clear()
         
         # Reset user type
         self.user_type_var.set("individual")
@@ -618,10 +768,10 @@ def load_sample_data(self):
         self.clear_form()
         
         # Set sample data
-        self.fields['name'].set_value("John Doe")
-        self.fields['email'].set_value("john.doe@example.com")
-        self.fields['phone'].set_value("(555) 123-4567")
-        self.fields['age'].set_value("30")
+        self.get_field('name').set_value("John Doe")
+        self.get_field('email').set_value("john.doe@example.com")
+        self.get_field('phone').set_value("(555) 123-4567")
+        self.get_field('age').set_value("30")
         
         # Set user type to business
         self.user_type_var.set("business")
@@ -644,22 +794,28 @@ def __init__(self, root):
         self.root.title("Advanced Forms Demo")
         self.root.geometry("800x700")
         
+        self.scroll_after_id = None
+        self.configure_styles()
         self.create_widgets()
     
+    def configure_styles(self):
+        """Define the shared ttk styles used by the form"""
+        style = ttk.Style(self.root)
+        style.configure("Title.TLabel", font=("Arial", 14, "bold"), foreground="#2C3E50")
+        style.configure("Section.TLabelframe.Label", font=("Arial", 12, "bold"))
+    
     def create_widgets(self):
         """Create the main application widgets"""
         # Configure main window
         self.root.configure(bg="#ECF0F1")
         
         # Create scrollable frame
-        canvas = tk.Canvas(self.root, bg="#ECF0F1")
+        self.canvas = tk.Canvas(self.root, bg="#ECF0F1")
+        canvas = self.canvas
         scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=canvas.yview)
         scrollable_frame = tk.Frame(canvas, bg="#ECF0F1")
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        scrollable_frame.bind("<Configure>", self.schedule_scroll_update)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -671,6 +827,17 @@ def create_widgets(self):
         # Pack canvas and scrollbar
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
+    
+    def schedule_scroll_update(self, event=None):
+        """Coalesce resize events into a single scroll region update"""
+        if self.scroll_after_id is not None:
+            self.root.after_cancel(self.scroll_after_id)
+        self.scroll_after_id = self.root.after(50, self.update_scroll_region)
+    
+    def update_scroll_region(self):
+        """Fit the scroll region to the form contents"""
+        self.scroll_after_id = None
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
 
 def main():
@@ -8,9 +8,63 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 import random
+import numpy as np
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+RNG = np.random.default_rng()
+
+# =============================================================================
+# SHARED FONTS AND COLORS
+# =============================================================================
+
+HEADER_COLOR = "#2C3E50"
+MUTED_COLOR = "#7F8C8D"
+CARD_TEXT_COLOR = "white"
+WINDOW_COLOR = "#ECF0F1"
+
+# Named Tk fonts, created once and referenced by name from every widget
+DISPLAY_FONT = "DashboardDisplay"
+TITLE_FONT = "DashboardTitle"
+HEADING_FONT = "DashboardHeading"
+SECTION_FONT = "DashboardSection"
+TEXT_FONT = "DashboardText"
+BODY_FONT = "DashboardBody"
+
+FONT_SPECS = {
+    DISPLAY_FONT: {"family": "Arial", "size": 18, "weight": "bold"},
+    TITLE_FONT: {"family": "Arial", "size": 16, "weight": "bold"},
+    HEADING_FONT: {"family": "Arial", "size": 14, "weight": "bold"},
+    SECTION_FONT: {"family": "Arial", "size": 12, "weight": "bold"},
+    TEXT_FONT: {"family": "Arial", "size": 12},
+    BODY_FONT: {"family": "Arial", "size": 10}
+}
+
+
+def create_shared_fonts(root):
+    """Create the shared named fonts that do not exist yet"""
+    existing = tkfont.names(root)
+    return [tkfont.Font(root, name=name, **spec)
+            for name, spec in FONT_SPECS.items() if name not in existing]
+
+# =============================================================================
+# DATA MODEL
+# =============================================================================
+
+@dataclass
+class Record:
+    """A row of the data management table"""
+    __slots__ = ('id', 'name', 'category', 'value', 'status', 'date')
+    
+    id: int
+    name: str
+    category: str
+    value: int
+    status: str
+    date: str
+
 # =============================================================================
 # TAB CONTENT WIDGETS
 # =============================================================================
@@ -35,6 +89,19 @@ def refresh_content(self):
 class OverviewTab(DashboardTab):
     """Overview tab with summary information"""
     
+    ACTIVITIES = (
+        "New user registration: john.doe@example.com",
+        "Order #12345 completed - $299.99",
+        "System backup completed successfully",
+        "New product added: Premium Widget",
+        "User login: admin@company.com",
+        "Database maintenance completed",
+        "Email campaign sent to 1,000 subscribers",
+        "Payment processed: Order #12344",
+        "System update installed: v2.1.0",
+        "New customer support ticket created"
+    )
+    
     def __init__(self, parent, **kwargs):
         super().__init__(parent, title="Overview", **kwargs)
     
@@ -44,8 +111,8 @@ def create_widgets(self):
         title_label = tk.Label(
             self,
             text="Dashboard Overview",
-            font=("Arial", 16, "bold"),
-            fg="#2C3E50"
+            font=TITLE_FONT,
+            fg=HEADER_COLOR
         )
         title_label.pack(pady=20)
         
@@ -59,6 +126,9 @@ def create_widgets(self):
         self.create_summary_card(cards_frame, "Revenue", "$45,678", "#E74C3C", 0, 2)
         self.create_summary_card(cards_frame, "Orders", "890", "#F39C12", 0, 3)
         
+        # Configure grid weights for all card columns in one call
+        cards_frame.grid_columnconfigure((0, 1, 2, 3), weight=1)
+        
         # Recent activity frame
         activity_frame = tk.Frame(self)
         activity_frame.pack(fill="both", expand=True, padx=20, pady=10)
@@ -67,8 +137,8 @@ def create_widgets(self):
         activity_title = tk.Label(
             activity_frame,
             text="Recent Activity",
-            font=("Arial", 14, "bold"),
-            fg="#2C3E50"
+            font=HEADING_FONT,
+            fg=HEADER_COLOR
         )
         activity_title.pack(anchor="w", pady=(0, 10))
         
@@ -76,15 +146,24 @@ def create_widgets(self):
         self.activity_listbox = tk.Listbox(
             activity_frame,
             height=10,
-            font=("Arial", 10),
+            font=BODY_FONT,
             selectmode="none"
         )
         self.activity_listbox.pack(fill="both", expand=True)
         
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(activity_frame, orient="vertical", command=self.activity_listbox.yview)
-        scrollbar.pack(side="right", fill="y")
-        self.activity_listbox.configure(yscrollcommand=scrollbar.set)
+        # Add scrollbar; the listbox only holds the visible window of entries,
+        # so scrolling is driven by the full activity list instead of yview
+        self.activity_scrollbar = ttk.Scrollbar(activity_frame, orient="vertical",
+                                                command=self.scroll_activity)
+        self.activity_scrollbar.pack(side="right", fill="y")
+        
+        self.activities = []
+        self.activity_top = 0
+        self.activity_rows = int(self.activity_listbox.cget("height"))
+        self.activity_listbox.bind("<Configure>", self.on_activity_resize)
+        self.activity_listbox.bind("<MouseWheel>", self.on_activity_wheel)
+        self.activity_listbox.bind("<Button-4>", self.on_activity_wheel)
+        self.activity_listbox.bind("<Button-5>", self.on_activity_wheel)
         
         # Load sample activity
         self.load_recent_activity()
@@ -98,8 +177,8 @@ def create_summary_card(self, parent, title, value, color, row, col):
         title_label = tk.Label(
             card,
             text=title,
-            font=("Arial", 12, "bold"),
-            fg="white",
+            font=SECTION_FONT,
+            fg=CARD_TEXT_COLOR,
             bg=color
         )
         title_label.pack(pady=(10, 5))
@@ -108,49 +187,103 @@ def create_summary_card(self, parent, title, value, color, row, col):
         value_label = tk.Label(
             card,
             text=value,
-            font=("Arial", 18, "bold"),
-            fg="white",
+            font=DISPLAY_FONT,
+            fg=CARD_TEXT_COLOR,
             bg=color
         )
         value_label.pack(pady=(0, 10))
-        
-        # Configure grid weights
-        parent.grid_columnconfigure(col, weight=1)
     
     def load_recent_activity(self):
         """Load sample recent activity"""
-        activities = [
-            "New user registration: john.doe@example.com",
-            "Order #12345 completed - $299.99",
-            "System backup completed successfully",
-            "New product added: Premium Widget",
-            "User login: admin@company.com",
-            "Database maintenance completed",
-            "Email campaign sent to 1,000 subscribers",
-            "Payment processed: Order #12344",
-            "System update installed: v2.1.0",
-            "New customer support ticket created"
+        now = datetime.now()
+        offsets = random.sample(range(1, 61), len(self.ACTIVITIES))
+        self.activities = [
+            f"[{(now - timedelta(minutes=minutes)).strftime('%H:%M')}] {activity}"
+            for minutes, activity in zip(offsets, self.ACTIVITIES)
         ]
+        self.show_activity_window(0)
+    
+    def show_activity_window(self, top):
+        """Fill the listbox with the activity entries starting at top"""
+        total = len(self.activities)
+        top = max(0, min(top, total - self.activity_rows))
+        self.activity_top = top
         
-        for activity in activities:
-            timestamp = datetime.now() - timedelta(minutes=random.randint(1, 60))
-            time_str = timestamp.strftime("%H:%M")
-            self.activity_listbox.insert("end", f"[{time_str}] {activity}")
+        # Replace the visible slice in two calls
+        self.activity_listbox.delete(0, tk.END)
+        self.activity_listbox.insert("end", *self.activities[top:top + self.activity_rows])
+        
+        if total:
+            self.activity_scrollbar.set(top / total, min(top + self.activity_rows, total) / total)
+        else:
+            self.activity_scrollbar.set(0, 1)
+    
+    def scroll_activity(self, action, amount, unit=None):
+        """Handle scrollbar commands for the activity list"""
+        if action == "moveto":
+            top = int(float(amount) * len(self.activities))
+        else:
+            step = self.activity_rows if unit == "pages" else 1
+            top = self.activity_top + int(amount) * step
+        self.show_activity_window(top)
+    
+    def on_activity_wheel(self, event):
+        """Scroll the activity list with the mouse wheel"""
+        direction = -1 if event.num == 4 or event.delta > 0 else 1
+        self.show_activity_window(self.activity_top + direction)
+        return "break"
+    
+    def on_activity_resize(self, event):
+        """Show as many entries as fit in the resized listbox"""
+        line_height = tkfont.nametofont(BODY_FONT).metrics("linespace")
+        listbox = self.activity_listbox
+        inset = 2 * (int(listbox.cget("borderwidth")) + int(listbox.cget("highlightthickness")))
+        rows = max(1, (event.height - inset) // line_height)
+        if rows != self.activity_rows:
+            self.activity_rows = rows
+            self.show_activity_window(self.activity_top)
     
     def refresh_content(self):
         """Refresh overview content"""
-        # Clear activity list
-        self.activity_listbox.delete(0, tk.END)
-        # Reload activity
         self.load_recent_activity()
 
 
 class DataTab(DashboardTab):
     """Data management tab with Treeview"""
     
+    FILTER_DELAY = 150  # ms of typing pause before the table is filtered
+    SAMPLE_SIZE = 20
+    SAMPLE_CATEGORIES = ("Product", "Service", "Support", "Marketing", "Sales")
+    SAMPLE_STATUSES = ("Active", "Inactive", "Pending", "Completed")
+    SAMPLE_NAMES = (
+        "Widget A", "Service B", "Support Ticket", "Campaign C", "Sale D",
+        "Product E", "Consultation", "Bug Report", "Email Campaign", "Deal F"
+    )
+    
+    # Row background per status, applied through Treeview tags
+    STATUS_COLORS = {
+        "active": "#E8F8F5",
+        "inactive": "#F2F3F4",
+        "pending": "#FEF9E7",
+        "completed": "#EBF5FB"
+    }
+    
+    # Tcl helper that inserts a whole list of rows in one call from Python
+    INSERT_ROWS_PROC = """
+        proc dashboard_insert_rows {tree rows} {
+            foreach row $rows {
+                lassign $row values tag
+                $tree insert {} end -values $values -tags [list $tag]
+            }
+        }
+    """
+    
     def __init__(self, parent, **kwargs):
-        super().__init__(parent, title="Data Management", **kwargs)
+        # Data must exist before create_widgets loads it into the table
         self.data = self.generate_sample_data()
+        self.next_id = max(self.data, default=0) + 1
+        self.row_cache = {}
+        super().__init__(parent, title="Data Management", **kwargs)
     
     def create_widgets(self):
         """Create data management content"""
@@ -158,8 +291,8 @@ def create_widgets(self):
         title_label = tk.Label(
             self,
             text="Data Management",
-            font=("Arial", 16, "bold"),
-            fg="#2C3E50"
+            font=TITLE_FONT,
+            fg=HEADER_COLOR
         )
         title_label.pack(pady=20)
         
@@ -198,11 +331,12 @@ def create_widgets(self):
         search_frame = tk.Frame(self)
         search_frame.pack(fill="x", padx=20, pady=5)
         
-        search_label = tk.Label(search_frame, text="Search:", font=("Arial", 10))
+        search_label = tk.Label(search_frame, text="Search:", font=BODY_FONT)
         search_label.pack(side="left", padx=(0, 5))
         
+        self.filter_after_id = None
         self.search_var = tk.StringVar()
-        self.search_var.trace("w", self.filter_data)
+        self.search_var.trace_add("write", self.on_search_change)
         search_entry = tk.Entry(search_frame, textvariable=self.search_var, width=30)
         search_entry.pack(side="left", padx=(0, 10))
         
@@ -210,19 +344,24 @@ def create_widgets(self):
         table_frame = tk.Frame(self)
         table_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
+        # Fixed row height so rows never need to be measured
+        style = ttk.Style(self)
+        style.configure("Fixed.Treeview", rowheight=20)
+        
         # Create Treeview
         columns = ("ID", "Name", "Category", "Value", "Status", "Date")
-        self.tree = ttk.Treeview(table_frame, columns=columns, show="headings", height=12)
+        self.tree = ttk.Treeview(table_frame, columns=columns, show="headings", height=12,
+                                 style="Fixed.Treeview")
         
-        # Configure columns
+        # Configure columns with fixed widths
+        widths = {"Name": 150, "Category": 120, "Date": 120}
         for col in columns:
             self.tree.heading(col, text=col)
-            self.tree.column(col, width=100, minwidth=80)
+            self.tree.column(col, width=widths.get(col, 100), minwidth=80, stretch=False)
         
-        # Configure specific widths
-        self.tree.column("Name", width=150)
-        self.tree.column("Category", width=120)
-        self.tree.column("Date", width=120)
+        # Status tags, configured once for all rows
+        for status, color in self.STATUS_COLORS.items():
+            self.tree.tag_configure(status, background=color)
         
         # Create scrollbars
         v_scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
@@ -238,57 +377,82 @@ def create_widgets(self):
         table_frame.grid_columnconfigure(0, weight=1)
         table_frame.grid_rowconfigure(0, weight=1)
         
+        # Register the bulk insert helper
+        self.tk.eval(self.INSERT_ROWS_PROC)
+        
         # Load data
         self.load_data()
     
     def generate_sample_data(self):
-        """Generate sample data"""
-        categories = ["Product", "Service", "Support", "Marketing", "Sales"]
-        statuses = ["Active", "Inactive", "Pending", "Completed"]
-        names = [
-            "Widget A", "Service B", "Support Ticket", "Campaign C", "Sale D",
-            "Product E", "Consultation", "Bug Report", "Email Campaign", "Deal F"
-        ]
-        
-        data = []
-        for i in range(20):
-            data.append({
-                'id': i + 1,
-                'name': random.choice(names),
-                'category': random.choice(categories),
-                'value': random.randint(100, 5000),
-                'status': random.choice(statuses),
-                'date': (datetime.now() - timedelta(days=random.randint(1, 30))).strftime('%Y-%m-%d')
-            })
-        
-        return data
+        """Generate sample data as a dict of Records keyed by id"""
+        # Draw every column in one vectorized call each
+        count = self.SAMPLE_SIZE
+        ids = range(1, count + 1)
+        name_col = RNG.choice(self.SAMPLE_NAMES, count).tolist()
+        category_col = RNG.choice(self.SAMPLE_CATEGORIES, count).tolist()
+        value_col = RNG.integers(100, 5001, count).tolist()
+        status_col = RNG.choice(self.SAMPLE_STATUSES, count).tolist()
+        day_col = RNG.integers(1, 31, count).tolist()
+        
+        # Format each possible date once
+        today = datetime.now()
+        dates = {days: (today - timedelta(days=days)).strftime('%Y-%m-%d') for days in range(1, 31)}
+        
+        return {
+            record_id: Record(record_id, name, category, value, status, dates[days])
+            for record_id, name, category, value, status, days
+            in zip(ids, name_col, category_col, value_col, status_col, day_col)
+        }
     
     def load_data(self):
         """Load data into Treeview"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Insert data
-        for row in self.data:
-            values = [row['id'], row['name'], row['category'], 
-                     f"${row['value']}", row['status'], row['date']]
-            self.tree.insert("", "end", values=values)
+        # Display values and lowercased search text, formatted once per record
+        self.search_index = []
+        for record_id, row in self.data.items():
+            entry = self.row_cache.get(record_id)
+            if entry is None:
+                item = self.format_row(row)
+                entry = self.row_cache[record_id] = (item, " ".join(map(str, item[0])).lower())
+            self.search_index.append(entry)
+        
+        self.last_query = ""
+        self.last_matches = self.search_index
+        self.populate_tree([item for item, text in self.search_index])
+    
+    def on_search_change(self, *args):
+        """Restart the filter timer while the user is typing"""
+        if self.filter_after_id is not None:
+            self.after_cancel(self.filter_after_id)
+        self.filter_after_id = self.after(self.FILTER_DELAY, self.filter_data)
     
     def filter_data(self, *args):
         """Filter data based on search term"""
+        self.filter_after_id = None
         search_term = self.search_var.get().lower()
         
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # A longer query can only match rows the previous query matched
+        if search_term.startswith(self.last_query):
+            candidates = self.last_matches
+        else:
+            candidates = self.search_index
         
-        # Filter and insert data
-        for row in self.data:
-            if search_term in str(row).lower():
-                values = [row['id'], row['name'], row['category'], 
-                         f"${row['value']}", row['status'], row['date']]
-                self.tree.insert("", "end", values=values)
+        self.last_matches = [entry for entry in candidates if search_term in entry[1]]
+        self.last_query = search_term
+        self.populate_tree([item for item, text in self.last_matches])
+    
+    def format_row(self, row):
+        """Return the Treeview column values and status tag for a record"""
+        values = (row.id, row.name, row.category,
+                  f"${row.value}", row.status, row.date)
+        return values, row.status.lower()
+    
+    def populate_tree(self, rows):
+        """Replace the Treeview contents with the given (values, tag) rows"""
+        # Clear existing items in a single call
+        self.tree.delete(*self.tree.get_children())
+        
+        # Insert all rows with a single Python-to-Tcl call
+        self.tk.call("dashboard_insert_rows", self.tree, tuple(rows))
     
     def add_record(self):
         """Add a new record"""
@@ -320,15 +484,16 @@ def add_record(self):
     def save_record(self, name, category, dialog):
         """Save the new record"""
         if name and category:
-            new_record = {
-                'id': len(self.data) + 1,
-                'name': name,
-                'category': category,
-                'value': random.randint(100, 5000),
-                'status': 'Active',
-                'date': datetime.now().strftime('%Y-%m-%d')
-            }
-            self.data.append(new_record)
+            new_record = Record(
+                id=self.next_id,
+                name=name,
+                category=category,
+                value=random.randint(100, 5000),
+                status='Active',
+                date=datetime.now().strftime('%Y-%m-%d')
+            )
+            self.data[new_record.id] = new_record
+            self.next_id += 1
             self.load_data()
             dialog.destroy()
         else:
@@ -347,16 +512,16 @@ def delete_selected(self):
             values = item['values']
             
             # Remove from data
-            for i, row in enumerate(self.data):
-                if row['id'] == values[0]:
-                    del self.data[i]
-                    break
+            self.data.pop(values[0], None)
+            self.row_cache.pop(values[0], None)
             
             self.load_data()
     
     def refresh_content(self):
         """Refresh data content"""
         self.data = self.generate_sample_data()
+        self.next_id = max(self.data, default=0) + 1
+        self.row_cache.clear()
         self.load_data()
 
 
@@ -364,14 +529,15 @@ class SettingsTab(DashboardTab):
     """Settings tab with configuration options"""
     
     def __init__(self, parent, **kwargs):
-        super().__init__(parent, title="Settings", **kwargs)
+        # Variables must exist before create_widgets binds them
         self.settings = {
-            'auto_refresh': tk.BooleanVar(value=True),
-            'notifications': tk.BooleanVar(value=True),
-            'theme': tk.StringVar(value="light"),
-            'refresh_interval': tk.StringVar(value="30"),
-            'max_records': tk.StringVar(value="1000")
+            'auto_refresh': tk.BooleanVar(parent, value=True),
+            'notifications': tk.BooleanVar(parent, value=True),
+            'theme': tk.StringVar(parent, value="light"),
+            'refresh_interval': tk.StringVar(parent, value="30"),
+            'max_records': tk.StringVar(parent, value="1000")
         }
+        super().__init__(parent, title="Settings", **kwargs)
     
     def create_widgets(self):
         """Create settings content"""
@@ -379,8 +545,8 @@ def create_widgets(self):
         title_label = tk.Label(
             self,
             text="Dashboard Settings",
-            font=("Arial", 16, "bold"),
-            fg="#2C3E50"
+            font=TITLE_FONT,
+            fg=HEADER_COLOR
         )
         title_label.pack(pady=20)
         
@@ -396,13 +562,13 @@ def create_widgets(self):
             settings_frame,
             text="Enable auto-refresh",
             variable=self.settings['auto_refresh'],
-            font=("Arial", 10)
+            font=BODY_FONT
         )
         auto_refresh_cb.grid(row=1, column=0, sticky="w", padx=20, pady=5)
         
         # Refresh interval
         tk.Label(settings_frame, text="Refresh interval (seconds):", 
-                font=("Arial", 10)).grid(row=2, column=0, sticky="w", padx=20, pady=5)
+                font=BODY_FONT).grid(row=2, column=0, sticky="w", padx=20, pady=5)
         refresh_entry = tk.Entry(settings_frame, textvariable=self.settings['refresh_interval'], width=10)
         refresh_entry.grid(row=2, column=1, sticky="w", padx=10, pady=5)
         
@@ -414,7 +580,7 @@ def create_widgets(self):
             settings_frame,
             text="Enable notifications",
             variable=self.settings['notifications'],
-            font=("Arial", 10)
+            font=BODY_FONT
         )
         notifications_cb.grid(row=5, column=0, sticky="w", padx=20, pady=5)
         
@@ -423,7 +589,7 @@ def create_widgets(self):
         
         # Theme selection
         tk.Label(settings_frame, text="Theme:", 
-                font=("Arial", 10)).grid(row=8, column=0, sticky="w", padx=20, pady=5)
+                font=BODY_FONT).grid(row=8, column=0, sticky="w", padx=20, pady=5)
         theme_combo = ttk.Combobox(
             settings_frame,
             textvariable=self.settings['theme'],
@@ -435,7 +601,7 @@ def create_widgets(self):
         
         # Max records
         tk.Label(settings_frame, text="Max records to display:", 
-                font=("Arial", 10)).grid(row=9, column=0, sticky="w", padx=20, pady=5)
+                font=BODY_FONT).grid(row=9, column=0, sticky="w", padx=20, pady=5)
         max_records_entry = tk.Entry(settings_frame, textvariable=self.settings['max_records'], width=10)
         max_records_entry.grid(row=9, column=1, sticky="w", padx=10, pady=5)
         
@@ -466,8 +632,8 @@ def create_section(self, parent, title, row):
         section_label = tk.Label(
             parent,
             text=title,
-            font=("Arial", 12, "bold"),
-            fg="#2C3E50"
+            font=SECTION_FONT,
+            fg=HEADER_COLOR
         )
         section_label.grid(row=row, column=0, columnspan=2, sticky="w", padx=10, pady=(20, 10))
         
@@ -503,9 +669,17 @@ def refresh_content(self):
 class NotebookDashboard(tk.Frame):
     """Main dashboard with tabbed interface"""
     
+    # Main tabs whose content is built the first time they are selected
+    LAZY_TABS = {
+        "Data Management": DataTab,
+        "Settings": SettingsTab
+    }
+    
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
         self.tabs = {}
+        self.dirty_tabs = set()
+        self.fonts = create_shared_fonts(self)
         self.create_widgets()
     
     def create_widgets(self):
@@ -514,8 +688,8 @@ def create_widgets(self):
         title_label = tk.Label(
             self,
             text="Professional Dashboard",
-            font=("Arial", 18, "bold"),
-            fg="#2C3E50"
+            font=DISPLAY_FONT,
+            fg=HEADER_COLOR
         )
         title_label.pack(pady=20)
         
@@ -562,24 +736,24 @@ def create_widgets(self):
     
     def create_tabs(self):
         """Create the main tabs"""
-        # Overview tab
+        # Overview tab is shown first, so build it right away
         overview_tab = OverviewTab(self.notebook)
         self.notebook.add(overview_tab, text="Overview")
         self.tabs["Overview"] = overview_tab
         
-        # Data tab
-        data_tab = DataTab(self.notebook)
-        self.notebook.add(data_tab, text="Data Management")
-        self.tabs["Data Management"] = data_tab
-        
-        # Settings tab
-        settings_tab = SettingsTab(self.notebook)
-        self.notebook.add(settings_tab, text="Settings")
-        self.tabs["Settings"] = settings_tab
+        # Other main tabs start as empty frames until they are selected
+        for tab_name in self.LAZY_TABS:
+            self.notebook.add(tk.Frame(self.notebook), text=tab_name)
+    
+    def build_lazy_tab(self, tab_name, container):
+        """Create the content of a lazily built tab inside its frame"""
+        tab = self.LAZY_TABS[tab_name](container)
+        tab.pack(fill="both", expand=True)
+        self.tabs[tab_name] = tab
     
     def add_custom_tab(self):
         """Add a custom tab"""
-        tab_name = f"Custom Tab {len(self.tabs) + 1}"
+        tab_name = f"Custom Tab {self.notebook.index('end') + 1}"
         
         # Create custom tab content
         custom_tab = tk.Frame(self.notebook)
@@ -588,16 +762,16 @@ def add_custom_tab(self):
         title_label = tk.Label(
             custom_tab,
             text=f"Custom Tab Content",
-            font=("Arial", 16, "bold"),
-            fg="#2C3E50"
+            font=TITLE_FONT,
+            fg=HEADER_COLOR
         )
         title_label.pack(pady=50)
         
         content_label = tk.Label(
             custom_tab,
             text="This is a dynamically added tab.\nYou can add any content here.",
-            font=("Arial", 12),
-            fg="#7F8C8D"
+            font=TEXT_FONT,
+            fg=MUTED_COLOR
         )
         content_label.pack(pady=20)
         
@@ -621,12 +795,20 @@ def remove_current_tab(self):
                 self.notebook.forget(tab_id)
                 if tab_text in self.tabs:
                     del self.tabs[tab_text]
+                self.dirty_tabs.discard(tab_text)
     
     def refresh_all_tabs(self):
-        """Refresh all tabs"""
+        """Refresh the visible tab and mark the others for refresh on next visit"""
+        current_tab = self.notebook.select()
+        current_text = self.notebook.tab(current_tab, "text") if current_tab else None
+        
         for tab_name, tab in self.tabs.items():
-            if hasattr(tab, 'refresh_content'):
+            if not hasattr(tab, 'refresh_content'):
+                continue
+            if tab_name == current_text:
                 tab.refresh_content()
+            else:
+                self.dirty_tabs.add(tab_name)
         
         messagebox.showinfo("Success", "All tabs refreshed!")
     
@@ -636,6 +818,13 @@ def on_tab_changed(self, event):
         if current_tab:
             tab_id = self.notebook.index(current_tab)
             tab_text = self.notebook.tab(tab_id, "text")
+            
+            if tab_text in self.LAZY_TABS and tab_text not in self.tabs:
+                self.build_lazy_tab(tab_text, self.notebook.nametowidget(current_tab))
+            elif tab_text in self.dirty_tabs:
+                self.dirty_tabs.discard(tab_text)
+                self.tabs[tab_text].refresh_content()
+            
             print(f"Switched to tab: {tab_text}")
 
 
@@ -656,7 +845,7 @@ def __init__(self, root):
     def create_widgets(self):
         """Create the main application widgets"""
         # Configure main window
-        self.root.configure(bg="#ECF0F1")
+        self.root.configure(bg=WINDOW_COLOR)
         
         # Create dashboard
         self.dashboard = NotebookDashboard(self.root)
@@ -9,10 +9,11 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
+import heapq
+import textwrap
 import time
+from functools import partial
 import random
-from datetime import datetime
 
 # =============================================================================
 # STATUS BAR COMPONENTS
@@ -24,6 +25,7 @@ class StatusBar(tk.Frame):
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
         self.status_sections = {}
+        self.last_time_text = None
         self.create_widgets()
     
     def create_widgets(self):
@@ -35,19 +37,16 @@ def create_widgets(self):
         self.status_sections['main'] = tk.Label(
             self,
             text="Ready",
-            anchor="w",
-            relief="sunken",
-            borderwidth=1
+            anchor="w"
         )
         self.status_sections['main'].pack(side="left", fill="x", expand=True, padx=2, pady=1)
+        ttk.Separator(self, orient="vertical").pack(side="left", fill="y", pady=2)
         
         # Progress section (center)
         self.status_sections['progress'] = tk.Label(
             self,
             text="",
             anchor="center",
-            relief="sunken",
-            borderwidth=1,
             width=15
         )
         self.status_sections['progress'].pack(side="left", padx=2, pady=1)
@@ -57,13 +56,13 @@ def create_widgets(self):
             self,
             text="",
             anchor="e",
-            relief="sunken",
-            borderwidth=1,
             width=20
         )
         self.status_sections['time'].pack(side="right", padx=2, pady=1)
+        ttk.Separator(self, orient="vertical").pack(side="right", fill="y", pady=2)
         
-        # Start time updates
+        # Start time updates; show the time as soon as the bar appears
+        self.bind("<Map>", self.refresh_time)
         self.update_time()
     
     def set_status(self, message, section='main'):
@@ -73,19 +72,30 @@ def set_status(self, message, section='main'):
     
     def update_time(self):
         """Update the time display"""
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.set_status(current_time, 'time')
+        if self.winfo_ismapped():
+            self.refresh_time()
         self.after(1000, self.update_time)
+    
+    def refresh_time(self, event=None):
+        """Show the current time if the displayed second has changed"""
+        current_time = time.strftime("%H:%M:%S")
+        if current_time != self.last_time_text:
+            self.last_time_text = current_time
+            self.status_sections['time'].configure(text=current_time)
 
 
 class ProgressIndicator(tk.Frame):
     """Advanced progress indicator with multiple states"""
     
+    INDETERMINATE_INTERVAL = 30  # ms between indeterminate animation steps
+    INDETERMINATE_STEP = 3
+    
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
         self.progress_var = tk.DoubleVar()
         self.status_var = tk.StringVar()
         self.is_indeterminate = False
+        self.indeterminate_after_id = None
         self.create_widgets()
     
     def create_widgets(self):
@@ -120,6 +130,7 @@ def create_widgets(self):
     
     def start_progress(self, status="Processing..."):
         """Start the progress indicator"""
+        self.cancel_indeterminate()
         self.status_var.set(status)
         self.progress_var.set(0)
         self.is_indeterminate = False
@@ -137,13 +148,27 @@ def start_indeterminate(self, status="Processing..."):
         self.status_var.set(status)
         self.is_indeterminate = True
         self.progress_bar.configure(mode='indeterminate')
-        self.progress_bar.start(10)
+        self.cancel_indeterminate()
+        self.step_indeterminate()
         self.percentage_label.configure(text="")
     
+    def step_indeterminate(self):
+        """Advance the indeterminate animation while the bar is on screen"""
+        if self.winfo_ismapped():
+            self.progress_bar.step(self.INDETERMINATE_STEP)
+        self.indeterminate_after_id = self.after(self.INDETERMINATE_INTERVAL, self.step_indeterminate)
+    
+    def cancel_indeterminate(self):
+        """Stop the indeterminate animation loop"""
+        if self.indeterminate_after_id is not None:
+            self.after_cancel(self.indeterminate_after_id)
+            self.indeterminate_after_id = None
+    
     def stop_progress(self, status="Completed"):
         """Stop the progress indicator"""
         if self.is_indeterminate:
-            self.progress_bar.stop()
+            self.cancel_indeterminate()
+            self.is_indeterminate = False
             self.progress_bar.configure(mode='determinate')
         self.status_var.set(status)
         self.progress_var.set(100)
@@ -153,177 +178,235 @@ def stop_progress(self, status="Completed"):
 class LoadingSpinner(tk.Canvas):
     """Animated loading spinner widget"""
     
+    # Start angle of each of the eight 30 degree segments at rotation 0
+    SEGMENT_STARTS = tuple(i * 45 - 15 for i in range(8))
+    
+    FRAME_INTERVAL = 50  # ms between frames while visible
+    HIDDEN_INTERVAL = 500  # ms between visibility checks while hidden
+    
     def __init__(self, parent, size=30, **kwargs):
         super().__init__(parent, width=size, height=size, **kwargs)
         self.size = size
         self.angle = 0
         self.is_spinning = False
+        self.animate_after_id = None
+        self.arc_ids = []
         self.create_spinner()
     
     def create_spinner(self):
-        """Create the spinner graphics"""
-        # Clear canvas
-        self.delete("all")
-        
+        """Create the spinner graphics once; animation only rotates them"""
         # Calculate dimensions
         center = self.size // 2
         radius = (self.size - 4) // 2
         
-        # Draw spinner segments
-        for i in range(8):
-            angle = i * 45 + self.angle
-            start_angle = angle - 15
-            end_angle = angle + 15
-            
-            # Calculate opacity based on position
-            opacity = 1.0 - (i * 0.1)
-            if opacity < 0.1:
-                opacity = 0.1
-            
-            # Convert angle to radians
-            start_rad = start_angle * 3.14159 / 180
-            end_rad = end_angle * 3.14159 / 180
-            
-            # Calculate arc coordinates
-            x1 = center + radius * 0.6 * (1 - abs(start_rad))
-            y1 = center + radius * 0.6 * start_rad
-            x2 = center + radius * (1 - abs(end_rad))
-            y2 = center + radius * end_rad
-            
-            # Draw arc segment
-            self.create_arc(
+        # Draw spinner segments; the last two are stippled to fade out the tail
+        for i, segment_start in enumerate(self.SEGMENT_STARTS):
+            arc_id = self.create_arc(
                 center - radius, center - radius,
                 center + radius, center + radius,
-                start=start_angle, extent=30,
+                start=segment_start + self.angle, extent=30,
                 fill="", outline="#3498DB",
-                width=3, stipple="gray50" if opacity < 0.5 else ""
+                width=3, stipple="gray50" if i >= 6 else ""
             )
+            self.arc_ids.append(arc_id)
+    
+    def rotate_spinner(self):
+        """Move the existing arc segments to the current angle"""
+        for arc_id, segment_start in zip(self.arc_ids, self.SEGMENT_STARTS):
+            self.itemconfigure(arc_id, start=(segment_start + self.angle) % 360)
     
     def start_spinning(self):
         """Start the spinner animation"""
         self.is_spinning = True
-        self.animate()
+        if self.animate_after_id is None:
+            self.animate()
     
     def stop_spinning(self):
         """Stop the spinner animation"""
         self.is_spinning = False
+        if self.animate_after_id is not None:
+            self.after_cancel(self.animate_after_id)
+            self.animate_after_id = None
     
     def animate(self):
-        """Animate the spinner"""
-        if self.is_spinning:
+        """Animate the spinner, idling while it is not visible"""
+        if not self.is_spinning:
+            self.animate_after_id = None
+            return
+        
+        if self.winfo_viewable():
             self.angle = (self.angle + 10) % 360
-            self.create_spinner()
-            self.after(50, self.animate)
+            self.rotate_spinner()
+            self.animate_after_id = self.after(self.FRAME_INTERVAL, self.animate)
+        else:
+            self.animate_after_id = self.after(self.HIDDEN_INTERVAL, self.animate)
 
 
 class NotificationSystem(tk.Frame):
     """Notification system for displaying alerts and messages"""
     
+    COLORS = {
+        'info': '#3498DB',
+        'success': '#2ECC71',
+        'warning': '#F39C12',
+        'error': '#E74C3C'
+    }
+    
+    ICONS = {
+        'info': 'ℹ',
+        'success': '✓',
+        'warning': '⚠',
+        'error': '✗'
+    }
+    
+    EXPIRY_CHECK_INTERVAL = 250  # ms between sweeps for expired notifications
+    MESSAGE_WIDTH = 45  # characters per line, about 300 pixels of message text
+    
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
-        self.notifications = []
+        self.notifications = {}  # notification id -> notification details
         self.notification_id = 0
+        self.notification_pool = []
+        # Heap of (expiry time, notification id, frame) checked by one shared timer
+        self.expiry_heap = []
+        self.expiry_after_id = None
         self.create_widgets()
     
     def create_widgets(self):
         """Create the notification system interface"""
-        # Notification area (initially empty)
-        self.notification_area = tk.Frame(self)
-        self.notification_area.pack(fill="both", expand=True)
+        # Notification area is built when the first notification is shown
+        self.notification_area = None
+    
+    def ensure_notification_area(self):
+        """Create the notification area on first use"""
+        if self.notification_area is None:
+            self.notification_area = tk.Frame(self)
+            self.notification_area.pack(fill="both", expand=True)
+        return self.notification_area
     
     def show_notification(self, message, notification_type="info", duration=5000):
         """Show a notification message"""
         notification_id = self.notification_id
         self.notification_id += 1
+        color = self.get_notification_color(notification_type)
+        
+        # Reuse a hidden notification frame if one is available
+        if self.notification_pool:
+            notification_frame = self.notification_pool.pop()
+        else:
+            notification_frame = self.create_notification_frame()
+        
+        notification_frame.configure(bg=color)
+        notification_frame.icon_label.configure(
+            text=self.get_notification_icon(notification_type), bg=color
+        )
+        notification_frame.message_label.configure(
+            text=textwrap.fill(message, self.MESSAGE_WIDTH), bg=color
+        )
+        notification_frame.close_btn.configure(bg=color)
+        notification_frame.notification_id = notification_id
+        notification_frame.pack(fill="x", padx=5, pady=2)
         
-        # Create notification frame
+        # Store notification
+        self.notifications[notification_id] = {
+            'id': notification_id,
+            'frame': notification_frame,
+            'type': notification_type,
+            'message': message
+        }
+        
+        # Auto-close after duration
+        if duration > 0:
+            expires_at = time.monotonic() + duration / 1000
+            heapq.heappush(self.expiry_heap, (expires_at, notification_id, notification_frame))
+            if self.expiry_after_id is None:
+                self.expiry_after_id = self.after(self.EXPIRY_CHECK_INTERVAL, self.close_expired)
+        
+        return notification_id
+    
+    def create_notification_frame(self):
+        """Create an empty notification frame with its icon, message and close labels"""
         notification_frame = tk.Frame(
-            self.notification_area,
+            self.ensure_notification_area(),
             relief="raised",
-            borderwidth=1,
-            bg=self.get_notification_color(notification_type)
+            borderwidth=1
         )
-        notification_frame.pack(fill="x", padx=5, pady=2)
+        notification_frame.notification_id = None
         
         # Icon and message
-        icon_label = tk.Label(
+        notification_frame.icon_label = tk.Label(
             notification_frame,
-            text=self.get_notification_icon(notification_type),
             font=("Arial", 12),
-            bg=self.get_notification_color(notification_type),
             fg="white"
         )
-        icon_label.pack(side="left", padx=5, pady=5)
+        notification_frame.icon_label.pack(side="left", padx=5, pady=5)
         
-        message_label = tk.Label(
+        notification_frame.message_label = tk.Label(
             notification_frame,
-            text=message,
             font=("Arial", 9),
-            bg=self.get_notification_color(notification_type),
-            fg="white",
-            wraplength=300
+            fg="white"
         )
-        message_label.pack(side="left", fill="x", expand=True, padx=5, pady=5)
+        notification_frame.message_label.pack(side="left", fill="x", expand=True, padx=5, pady=5)
         
         # Close button
-        close_btn = tk.Label(
+        notification_frame.close_btn = tk.Label(
             notification_frame,
             text="×",
             font=("Arial", 14, "bold"),
-            bg=self.get_notification_color(notification_type),
             fg="white",
             cursor="hand2"
         )
-        close_btn.pack(side="right", padx=5, pady=5)
-        close_btn.bind("<Button-1>", lambda e: self.close_notification(notification_frame))
-        
-        # Store notification
-        self.notifications.append({
-            'id': notification_id,
-            'frame': notification_frame,
-            'type': notification_type,
-            'message': message
-        })
+        notification_frame.close_btn.pack(side="right", padx=5, pady=5)
+        notification_frame.close_btn.bind(
+            "<Button-1>", lambda e: self.close_notification(notification_frame)
+        )
         
-        # Auto-close after duration
-        if duration > 0:
-            self.after(duration, lambda: self.close_notification(notification_frame))
+        return notification_frame
+    
+    def close_expired(self):
+        """Close every notification whose display time has run out"""
+        now = time.monotonic()
+        while self.expiry_heap and self.expiry_heap[0][0] <= now:
+            expires_at, notification_id, notification_frame = heapq.heappop(self.expiry_heap)
+            self.close_notification(notification_frame, notification_id)
         
-        return notification_id
+        if self.expiry_heap:
+            self.expiry_after_id = self.after(self.EXPIRY_CHECK_INTERVAL, self.close_expired)
+        else:
+            self.expiry_after_id = None
     
     def get_notification_color(self, notification_type):
         """Get color for notification type"""
-        colors = {
-            'info': '#3498DB',
-            'success': '#2ECC71',
-            'warning': '#F39C12',
-            'error': '#E74C3C'
-        }
-        return colors.get(notification_type, colors['info'])
+        return self.COLORS.get(notification_type, self.COLORS['info'])
     
     def get_notification_icon(self, notification_type):
         """Get icon for notification type"""
-        icons = {
-            'info': 'ℹ',
-            'success': '✓',
-            'warning': '⚠',
-            'error': '✗'
-        }
-        return icons.get(notification_type, icons['info'])
+        return self.ICONS.get(notification_type, self.ICONS['info'])
     
-    def close_notification(self, notification_frame):
+    def close_notification(self, notification_frame, notification_id=None):
         """Close a specific notification"""
-        if notification_frame.winfo_exists():
-            notification_frame.destroy()
-            # Remove from notifications list
-            self.notifications = [n for n in self.notifications if n['frame'] != notification_frame]
+        # Ignore stale expiry entries for a frame that has been reused
+        if notification_id is not None and notification_frame.notification_id != notification_id:
+            return
+        if notification_frame.notification_id is None or not notification_frame.winfo_exists():
+            return
+        
+        self.notifications.pop(notification_frame.notification_id, None)
+        self.recycle_notification_frame(notification_frame)
+    
+    def recycle_notification_frame(self, notification_frame):
+        """Hide a notification frame and return it to the pool"""
+        notification_frame.pack_forget()
+        notification_frame.notification_id = None
+        self.notification_pool.append(notification_frame)
     
     def clear_all_notifications(self):
         """Clear all notifications"""
-        for notification in self.notifications:
+        for notification in self.notifications.values():
             if notification['frame'].winfo_exists():
-                notification['frame'].destroy()
+                self.recycle_notification_frame(notification['frame'])
         self.notifications.clear()
+        self.expiry_heap.clear()
 
 
 # =============================================================================
@@ -335,6 +418,9 @@ class StatusProgressDemo(tk.Frame):
     
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
+        # Simulated background task, stepped on the Tk thread with after()
+        self.task = None
+        self.task_after_id = None
         self.create_widgets()
     
     def create_widgets(self):
@@ -405,7 +491,7 @@ def create_widgets(self):
             btn = tk.Button(
                 status_frame,
                 text=message,
-                command=lambda m=message: self.set_status(m),
+                command=partial(self.set_status, message),
                 width=15
             )
             btn.pack(pady=2)
@@ -418,28 +504,28 @@ def create_widgets(self):
         tk.Button(
             notification_frame,
             text="Info Message",
-            command=lambda: self.show_notification("This is an informational message.", "info"),
+            command=partial(self.show_notification, "This is an informational message.", "info"),
             width=15
         ).pack(pady=2)
         
         tk.Button(
             notification_frame,
             text="Success Message",
-            command=lambda: self.show_notification("Operation completed successfully!", "success"),
+            command=partial(self.show_notification, "Operation completed successfully!", "success"),
             width=15
         ).pack(pady=2)
         
         tk.Button(
             notification_frame,
             text="Warning Message",
-            command=lambda: self.show_notification("Please check your input data.", "warning"),
+            command=partial(self.show_notification, "Please check your input data.", "warning"),
             width=15
         ).pack(pady=2)
         
         tk.Button(
             notification_frame,
             text="Error Message",
-            command=lambda: self.show_notification("An error occurred while processing.", "error"),
+            command=partial(self.show_notification, "An error occurred while processing.", "error"),
             width=15
         ).pack(pady=2)
         
@@ -493,29 +579,50 @@ def start_progress(self):
         """Start determinate progress"""
         self.progress_indicator.start_progress("Starting operation...")
         
-        def progress_worker():
-            for i in range(101):
-                if i % 10 == 0:
-                    self.after(0, self.progress_indicator.update_progress, i, f"Processing... {i}%")
-                time.sleep(0.1)
-            self.after(0, self.progress_indicator.stop_progress, "Operation completed!")
+        def progress_task():
+            for i in range(0, 101, 10):
+                self.progress_indicator.update_progress(i, f"Processing... {i}%")
+                yield 1000
+            self.progress_indicator.stop_progress("Operation completed!")
         
-        thread = threading.Thread(target=progress_worker, daemon=True)
-        thread.start()
+        self.run_task(progress_task())
     
     def start_indeterminate(self):
         """Start indeterminate progress"""
         self.progress_indicator.start_indeterminate("Processing in background...")
         
-        def indeterminate_worker():
-            time.sleep(3)
-            self.after(0, self.progress_indicator.stop_progress, "Background task completed!")
-        
-        thread = threading.Thread(target=indeterminate_worker, daemon=True)
-        thread.start()
+        def indeterminate_task():
+            yield 3000
+            self.progress_indicator.stop_progress("Background task completed!")
+        
+        self.run_task(indeterminate_task())
+    
+    def run_task(self, task):
+        """Run a task generator, waiting the number of ms it yields between steps"""
+        self.cancel_task()
+        self.task = task
+        self.step_task()
+    
+    def step_task(self):
+        """Advance the current task by one step"""
+        self.task_after_id = None
+        try:
+            delay = next(self.task)
+        except StopIteration:
+            self.task = None
+            return
+        self.task_after_id = self.after(delay, self.step_task)
+    
+    def cancel_task(self):
+        """Cancel the running task, if any"""
+        if self.task_after_id is not None:
+            self.after_cancel(self.task_after_id)
+            self.task_after_id = None
+        self.task = None
     
     def stop_progress(self):
         """Stop progress indicator"""
+        self.cancel_task()
         self.progress_indicator.stop_progress("Stopped by user")
     
     def set_status(self, message):
@@ -8,15 +8,25 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import random
-from datetime import datetime, timedelta
+from operator import itemgetter
+from bisect import bisect_right
+from itertools import accumulate
+import numpy as np
+
+RNG = np.random.default_rng()
+
+# Column order of the rows produced by generate_sample_data
+EMPLOYEE_COLUMNS = ("ID", "Name", "Age", "City", "Department", "Salary", "Status", "Hire Date")
+
+# Columns stored as ints, so typed values must convert for sorting to work
+INTEGER_COLUMNS = ("ID", "Age", "Salary")
 
 # =============================================================================
 # SAMPLE DATA GENERATION
 # =============================================================================
 
 def generate_sample_data(num_records=50):
-    """Generate sample data for the Treeview"""
+    """Generate sample rows for the Treeview as tuples in EMPLOYEE_COLUMNS order"""
     names = [
         "John Smith", "Emma Johnson", "Michael Brown", "Sarah Davis", "David Wilson",
         "Lisa Anderson", "James Taylor", "Jennifer Martinez", "Robert Garcia", "Amanda Rodriguez",
@@ -46,28 +56,33 @@ def generate_sample_data(num_records=50):
     departments = ["Engineering", "Sales", "Marketing", "HR", "Finance", "IT", "Operations"]
     statuses = ["Active", "Inactive", "Pending", "Suspended"]
     
-    data = []
-    for i in range(num_records):
-        name = random.choice(names)
-        age = random.randint(22, 65)
-        city = random.choice(cities)
-        department = random.choice(departments)
-        salary = random.randint(30000, 120000)
-        status = random.choice(statuses)
-        hire_date = datetime.now() - timedelta(days=random.randint(30, 3650))
-        
-        data.append({
-            'id': i + 1,
-            'name': name,
-            'age': age,
-            'city': city,
-            'department': department,
-            'salary': salary,
-            'status': status,
-            'hire_date': hire_date.strftime('%Y-%m-%d')
-        })
-    
-    return data
+    # Draw every column in one vectorized call each
+    name_col = RNG.choice(names, num_records).tolist()
+    age_col = RNG.integers(22, 66, num_records).tolist()
+    city_col = RNG.choice(cities, num_records).tolist()
+    department_col = RNG.choice(departments, num_records).tolist()
+    salary_col = RNG.integers(30000, 120001, num_records).tolist()
+    status_col = RNG.choice(statuses, num_records).tolist()
+    
+    # Hire dates between 30 days and 10 years ago, formatted as YYYY-MM-DD
+    days_ago = RNG.integers(30, 3651, num_records).astype('timedelta64[D]')
+    hire_date_col = (np.datetime64('today', 'D') - days_ago).astype(str).tolist()
+    
+    return list(zip(range(1, num_records + 1), name_col, age_col, city_col,
+                    department_col, salary_col, status_col, hire_date_col))
+
+def parse_entry_values(entries):
+    """Return the entries' text by column, with INTEGER_COLUMNS converted to int"""
+    values = {}
+    for col, entry in entries.items():
+        text = entry.get()
+        if col in INTEGER_COLUMNS:
+            try:
+                text = int(text.strip())
+            except ValueError:
+                raise ValueError(f"{col} must be a whole number.")
+        values[col] = text
+    return values
 
 # =============================================================================
 # TREEVIEW WIDGET CLASSES
@@ -76,15 +91,47 @@ def generate_sample_data(num_records=50):
 class DataTable(tk.Frame):
     """A reusable data table widget using Treeview"""
     
+    FILTER_DELAY = 150  # ms of typing pause before the table is filtered
+    
+    # Replaces the tree's items with rows whose ids count up from first,
+    # so a whole window is shown with one Python-to-Tcl call
+    SHOW_ROWS_PROC = """
+        proc datatable_show_rows {tree first rows} {
+            $tree delete [$tree children {}]
+            set id $first
+            foreach values $rows {
+                $tree insert {} end -id $id -values $values
+                incr id
+            }
+        }
+    """
+    
     def __init__(self, parent, columns, title="Data Table", **kwargs):
         super().__init__(parent, **kwargs)
         self.columns = columns
+        self.column_index = {col: i for i, col in enumerate(columns)}
         self.title = title
         self.data = []
-        self.filtered_data = []
+        # ID given to the next added row; never reused after a delete
+        self.next_id = 1
+        # Positions in self.data of the rows that match the search, in display order
+        self.filtered_rows = []
+        # Lowercased text of each row in self.data, in the same order, for searching
+        self.search_index = []
+        # search_index joined into one string, rebuilt on the next search after a change
+        self.search_blob = None
+        self.row_starts = []
         self.sort_column = None
         self.sort_reverse = False
         
+        # Only the rows in view are materialized in the Treeview
+        self.view_start = 0
+        self.visible_rows = 15
+        
+        # Row dialogs are built on first use and reused afterwards
+        self.add_dialog = None
+        self.edit_dialog = None
+        
         self.create_widgets()
     
     def create_widgets(self):
@@ -142,8 +189,9 @@ def create_widgets(self):
         search_label.pack(side="left", padx=(0, 5))
         
         # Search entry
+        self.filter_after_id = None
         self.search_var = tk.StringVar()
-        self.search_var.trace("w", self.filter_data)
+        self.search_var.trace_add("write", self.on_search_change)
         search_entry = tk.Entry(search_frame, textvariable=self.search_var, width=30)
         search_entry.pack(side="left", padx=(0, 10))
         
@@ -162,6 +210,7 @@ def create_widgets(self):
         
         # Create Treeview
         self.tree = ttk.Treeview(tree_frame, columns=self.columns, show="headings", height=15)
+        self.tk.eval(self.SHOW_ROWS_PROC)
         
         # Configure columns
         for col in self.columns:
@@ -175,14 +224,22 @@ def create_widgets(self):
         self.tree.column("Salary", width=80)
         self.tree.column("Hire Date", width=100)
         
-        # Create scrollbars
-        v_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        # Create scrollbars; vertical scrolling moves the window of rows
+        # shown in the tree, so the scrollbar drives on_scroll instead of yview
+        self.v_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.on_scroll)
         h_scrollbar = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.tree.configure(xscrollcommand=h_scrollbar.set)
+        
+        self.visible_rows = int(self.tree.cget("height"))
+        self.row_height = int(ttk.Style(self).lookup("Treeview", "rowheight") or 20)
+        self.tree.bind("<Configure>", self.on_tree_resize)
+        self.tree.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.tree.bind("<Button-4>", self.on_mouse_wheel)
+        self.tree.bind("<Button-5>", self.on_mouse_wheel)
         
         # Grid layout for treeview and scrollbars
         self.tree.grid(row=0, column=0, sticky="nsew")
-        v_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.v_scrollbar.grid(row=0, column=1, sticky="ns")
         h_scrollbar.grid(row=1, column=0, sticky="ew")
         
         # Configure grid weights
@@ -199,128 +256,212 @@ def create_widgets(self):
         status_bar.pack(fill="x", padx=5, pady=2)
     
     def load_data(self, data):
-        """Load data into the table"""
+        """Load rows (tuples in column order, or dicts keyed by column) into the table"""
+        # Dict rows are converted once, so everything downstream works on tuples
+        if data and isinstance(data[0], dict):
+            data = [self.row_from_dict(row) for row in data]
+        
         self.data = data
-        self.filtered_data = data.copy()
+        if "ID" in self.column_index:
+            id_index = self.column_index["ID"]
+            self.next_id = max((row[id_index] for row in data), default=0) + 1
+        self.search_index = [self.search_text(row) for row in data]
+        self.search_blob = None
+        self.filtered_rows = list(range(len(data)))
         self.refresh_display()
     
+    def row_from_dict(self, values):
+        """Return a row tuple in column order, filling missing INTEGER_COLUMNS with 0"""
+        return tuple(
+            values.get(col, 0 if col in INTEGER_COLUMNS else "") for col in self.columns
+        )
+    
+    def search_text(self, row):
+        """Return the lowercased text a search term is matched against"""
+        return " ".join(map(str, row)).lower()
+    
     def refresh_display(self):
         """Refresh the table display"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Insert filtered data
-        for row in self.filtered_data:
-            values = [row.get(col, "") for col in self.columns]
-            self.tree.insert("", "end", values=values)
+        self.render_window()
         
         # Update status
-        self.status_var.set(f"Showing {len(self.filtered_data)} of {len(self.data)} records")
+        self.status_var.set(f"Showing {len(self.filtered_rows)} of {len(self.data)} records")
+    
+    def render_window(self, keep_selection=False):
+        """Show the visible window of filtered rows starting at view_start"""
+        tree = self.tree
+        filtered_rows = self.filtered_rows
+        visible_rows = self.visible_rows
+        
+        total = len(filtered_rows)
+        start = max(0, min(self.view_start, total - visible_rows))
+        end = min(start + visible_rows, total)
+        self.view_start = start
+        
+        # Item ids are positions in filtered_rows, so a selection survives scrolling
+        selected = tree.selection() if keep_selection else ()
+        
+        # Swap in the visible rows with a single Tcl call; they are already in column order
+        rows = tuple(map(self.data.__getitem__, filtered_rows[start:end]))
+        self.tk.call("datatable_show_rows", tree, start, rows)
+        
+        still_visible = [iid for iid in selected if start <= int(iid) < end]
+        if still_visible:
+            tree.selection_set(still_visible)
+        
+        if total:
+            self.v_scrollbar.set(start / total, end / total)
+        else:
+            self.v_scrollbar.set(0, 1)
+    
+    def on_scroll(self, action, amount, unit=None):
+        """Handle vertical scrollbar commands"""
+        if action == "moveto":
+            self.view_start = int(float(amount) * len(self.filtered_rows))
+        else:
+            step = self.visible_rows if unit == "pages" else 1
+            self.view_start += int(amount) * step
+        self.render_window(keep_selection=True)
+    
+    def on_mouse_wheel(self, event):
+        """Scroll the row window with the mouse wheel"""
+        direction = -1 if event.num == 4 or event.delta > 0 else 1
+        self.view_start += direction * 3
+        self.render_window(keep_selection=True)
+        return "break"
+    
+    def on_tree_resize(self, event):
+        """Show as many rows as fit below the heading"""
+        rows = max(1, event.height // self.row_height - 1)
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self.render_window(keep_selection=True)
     
     def sort_by_column(self, column):
         """Sort data by column"""
         if self.sort_column == column:
             self.sort_reverse = not self.sort_reverse
         else:
+            # Only the previously sorted column carries an arrow to clear
+            if self.sort_column is not None:
+                self.tree.heading(self.sort_column, text=self.sort_column)
             self.sort_column = column
             self.sort_reverse = False
         
-        # Sort the filtered data
-        self.filtered_data.sort(
-            key=lambda x: x.get(column, ""),
-            reverse=self.sort_reverse
-        )
+        # Sort the filtered rows in place by their value in the column
+        keys = list(map(itemgetter(self.column_index[column]), self.data))
+        self.filtered_rows.sort(key=keys.__getitem__, reverse=self.sort_reverse)
         
         # Update column heading to show sort direction
-        for col in self.columns:
-            if col == column:
-                direction = " ▼" if self.sort_reverse else " ▲"
-                self.tree.heading(col, text=f"{col}{direction}")
-            else:
-                self.tree.heading(col, text=col)
+        direction = " ▼" if self.sort_reverse else " ▲"
+        self.tree.heading(column, text=f"{column}{direction}")
         
         self.refresh_display()
     
+    def on_search_change(self, *args):
+        """Restart the filter timer while the user is typing"""
+        if self.filter_after_id is not None:
+            self.after_cancel(self.filter_after_id)
+        self.filter_after_id = self.after(self.FILTER_DELAY, self.filter_data)
+    
     def filter_data(self, *args):
         """Filter data based on search term"""
+        self.filter_after_id = None
         search_term = self.search_var.get().lower()
         
         if search_term:
-            self.filtered_data = [
-                row for row in self.data
-                if any(search_term in str(value).lower() for value in row.values())
-            ]
+            self.filtered_rows = self.find_matches(search_term)
         else:
-            self.filtered_data = self.data.copy()
+            self.filtered_rows = list(range(len(self.data)))
         
-        # Reset sorting
+        # Reset sorting and clear the sort indicator
+        if self.sort_column is not None:
+            self.tree.heading(self.sort_column, text=self.sort_column)
         self.sort_column = None
         self.sort_reverse = False
         
-        # Clear sort indicators
-        for col in self.columns:
-            self.tree.heading(col, text=col)
-        
         self.refresh_display()
     
+    def selected_data_index(self):
+        """Return the position in self.data of the selected row, or None"""
+        selected = self.tree.selection()
+        if not selected:
+            return None
+        return self.filtered_rows[int(selected[0])]
+    
+    def find_matches(self, search_term):
+        """Return the positions in self.data of rows whose text contains search_term"""
+        if self.search_blob is None:
+            # NUL can't be typed into the search box, so no match spans two rows
+            self.search_blob = "\0".join(self.search_index)
+            offsets = accumulate(len(text) + 1 for text in self.search_index)
+            self.row_starts = [0, *offsets][:len(self.search_index)]
+        
+        # One scan over the whole blob, skipping to the next row after each hit
+        blob = self.search_blob
+        row_starts = self.row_starts
+        row_count = len(row_starts)
+        matches = []
+        pos = blob.find(search_term)
+        while pos != -1:
+            row = bisect_right(row_starts, pos) - 1
+            matches.append(row)
+            if row + 1 == row_count:
+                break
+            pos = blob.find(search_term, row_starts[row + 1])
+        return matches
+    
     def clear_search(self):
         """Clear the search filter"""
         self.search_var.set("")
     
     def add_row_dialog(self):
         """Open dialog to add a new row"""
-        dialog = AddRowDialog(self, self.columns)
-        self.wait_window(dialog)
+        if self.add_dialog is None:
+            self.add_dialog = AddRowDialog(self, self.columns)
+        dialog = self.add_dialog
+        dialog.show()
+        self.wait_variable(dialog.closed)
         
         if dialog.result:
             new_row = dialog.result
-            new_row['id'] = len(self.data) + 1
-            self.data.append(new_row)
+            new_row["ID"] = self.next_id
+            self.next_id += 1
+            row = self.row_from_dict(new_row)
+            self.data.append(row)
+            self.search_index.append(self.search_text(row))
+            self.search_blob = None
             self.filter_data()
     
     def delete_selected_row(self):
         """Delete the selected row"""
-        selected = self.tree.selection()
-        if not selected:
+        index = self.selected_data_index()
+        if index is None:
             messagebox.showwarning("Warning", "Please select a row to delete.")
             return
         
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete the selected row?"):
-            # Get the selected item's values
-            item = self.tree.item(selected[0])
-            values = item['values']
-            
-            # Find and remove from data
-            for i, row in enumerate(self.data):
-                if [row.get(col, "") for col in self.columns] == list(values):
-                    del self.data[i]
-                    break
-            
+            del self.data[index]
+            del self.search_index[index]
+            self.search_blob = None
             self.filter_data()
     
     def edit_row(self, event):
         """Edit the double-clicked row"""
-        selected = self.tree.selection()
-        if not selected:
+        index = self.selected_data_index()
+        if index is None:
             return
         
-        # Get the selected item's values
-        item = self.tree.item(selected[0])
-        values = item['values']
-        
-        # Create edit dialog
-        dialog = EditRowDialog(self, self.columns, values)
-        self.wait_window(dialog)
+        if self.edit_dialog is None:
+            self.edit_dialog = EditRowDialog(self, self.columns)
+        dialog = self.edit_dialog
+        dialog.show(self.data[index])
+        self.wait_variable(dialog.closed)
         
         if dialog.result:
-            # Find and update the row in data
-            for i, row in enumerate(self.data):
-                if [row.get(col, "") for col in self.columns] == list(values):
-                    for j, col in enumerate(self.columns):
-                        self.data[i][col] = dialog.result[j]
-                    break
-            
+            self.data[index] = tuple(dialog.result)
+            self.search_index[index] = self.search_text(self.data[index])
+            self.search_blob = None
             self.filter_data()
     
     def refresh_data(self):
@@ -336,6 +477,8 @@ def __init__(self, parent, columns):
         super().__init__(parent)
         self.columns = columns
         self.result = None
+        # Set each time the dialog is closed, so callers can wait_variable on it
+        self.closed = tk.BooleanVar(self, value=False)
         
         self.title("Add New Row")
         self.geometry("400x300")
@@ -343,7 +486,7 @@ def __init__(self, parent, columns):
         
         # Center the dialog
         self.transient(parent)
-        self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self.cancel)
         
         self.create_widgets()
     
@@ -392,30 +535,45 @@ def create_widgets(self):
     
     def save(self):
         """Save the new row"""
-        # Collect values
-        values = {}
-        for col in self.columns:
-            if col == "ID":
-                continue
-            values[col] = self.entries[col].get()
-        
-        self.result = values
-        self.destroy()
+        # Collect values; the ID column has no entry
+        try:
+            self.result = parse_entry_values(self.entries)
+        except ValueError as e:
+            messagebox.showerror("Invalid Value", str(e), parent=self)
+            return
+        self.close()
     
     def cancel(self):
         """Cancel the operation"""
         self.result = None
-        self.destroy()
+        self.close()
+    
+    def show(self):
+        """Clear the form and show the dialog"""
+        self.result = None
+        for entry in self.entries.values():
+            entry.delete(0, "end")
+        self.deiconify()
+        self.grab_set()
+        next(iter(self.entries.values())).focus_set()
+    
+    def close(self):
+        """Hide the dialog so it can be shown again"""
+        self.grab_release()
+        self.withdraw()
+        self.closed.set(True)
 
 
 class EditRowDialog(tk.Toplevel):
     """Dialog for editing an existing row"""
     
-    def __init__(self, parent, columns, values):
+    def __init__(self, parent, columns):
         super().__init__(parent)
         self.columns = columns
-        self.values = values
+        self.values = ()
         self.result = None
+        # Set each time the dialog is closed, so callers can wait_variable on it
+        self.closed = tk.BooleanVar(self, value=False)
         
         self.title("Edit Row")
         self.geometry("400x300")
@@ -423,7 +581,7 @@ def __init__(self, parent, columns, values):
         
         # Center the dialog
         self.transient(parent)
-        self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self.cancel)
         
         self.create_widgets()
     
@@ -449,7 +607,6 @@ def create_widgets(self):
             
             # Entry
             entry = tk.Entry(form_frame, width=30)
-            entry.insert(0, self.values[i])
             entry.grid(row=i, column=1, sticky="ew", padx=5, pady=2)
             self.entries[col] = entry
         
@@ -473,21 +630,43 @@ def create_widgets(self):
     
     def save(self):
         """Save the edited row"""
-        # Collect values
-        values = []
-        for col in self.columns:
-            if col == "ID":
-                values.append(self.values[self.columns.index(col)])
-            else:
-                values.append(self.entries[col].get())
+        try:
+            values = parse_entry_values(self.entries)
+        except ValueError as e:
+            messagebox.showerror("Invalid Value", str(e), parent=self)
+            return
         
-        self.result = values
-        self.destroy()
+        # Collect values in column order, keeping the original ID
+        self.result = [
+            self.values[i] if col == "ID" else values[col]
+            for i, col in enumerate(self.columns)
+        ]
+        self.close()
     
     def cancel(self):
         """Cancel the operation"""
         self.result = None
-        self.destroy()
+        self.close()
+    
+    def show(self, values):
+        """Fill the form with a row's values and show the dialog"""
+        self.values = values
+        self.result = None
+        for i, col in enumerate(self.columns):
+            if col == "ID":  # No entry for the ID field
+                continue
+            entry = self.entries[col]
+            entry.delete(0, "end")
+            entry.insert(0, values[i])
+        self.deiconify()
+        self.grab_set()
+        next(iter(self.entries.values())).focus_set()
+    
+    def close(self):
+        """Hide the dialog so it can be shown again"""
+        self.grab_release()
+        self.withdraw()
+        self.closed.set(True)
 
 
 # =============================================================================
@@ -531,8 +710,7 @@ def create_widgets(self):
         instructions.pack(pady=10)
         
         # Create data table
-        columns = ("ID", "Name", "Age", "City", "Department", "Salary", "Status", "Hire Date")
-        self.data_table = DataTable(self.root, columns, title="Employee Data")
+        self.data_table = DataTable(self.root, EMPLOYEE_COLUMNS, title="Employee Data")
         self.data_table.pack(fill="both", expand=True, padx=20, pady=10)
     
     def load_sample_data(self):
@@ -11,7 +11,55 @@
 from tkinter import ttk, messagebox
 import os
 from datetime import datetime
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import threading
+
+# =============================================================================
+# SQL BUILDERS
+# =============================================================================
+# Statements are built once per table and column list. The identical text
+# then lets the connection's statement cache reuse the prepared statement.
+
+@lru_cache(maxsize=256)
+def build_insert_sql(table, columns):
+    """Build an INSERT statement for a tuple of column names"""
+    placeholders = ', '.join('?' * len(columns))
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+@lru_cache(maxsize=256)
+def build_select_sql(table, condition_columns=(), order_by=None, paged=False, columns=None):
+    """Build a SELECT statement; LIMIT and OFFSET values are passed as parameters"""
+    query = f"SELECT {', '.join(columns) if columns else '*'} FROM {table}"
+    if condition_columns:
+        query += " WHERE " + ' AND '.join([f"{k} = ?" for k in condition_columns])
+    if order_by:
+        query += f" ORDER BY {order_by}"
+    if paged:
+        query += " LIMIT ? OFFSET ?"
+    return query
+
+@lru_cache(maxsize=256)
+def build_count_sql(table, condition_columns=()):
+    """Build a SELECT COUNT(*) statement for a tuple of WHERE column names"""
+    query = f"SELECT COUNT(*) FROM {table}"
+    if condition_columns:
+        query += " WHERE " + ' AND '.join([f"{k} = ?" for k in condition_columns])
+    return query
+
+@lru_cache(maxsize=256)
+def build_update_sql(table, set_columns, condition_columns):
+    """Build an UPDATE statement for tuples of SET and WHERE column names"""
+    set_clause = ', '.join([f"{k} = ?" for k in set_columns])
+    where_clause = ' AND '.join([f"{k} = ?" for k in condition_columns])
+    return f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
+
+@lru_cache(maxsize=256)
+def build_delete_sql(table, condition_columns):
+    """Build a DELETE statement for a tuple of WHERE column names"""
+    where_clause = ' AND '.join([f"{k} = ?" for k in condition_columns])
+    return f"DELETE FROM {table} WHERE {where_clause}"
 
 # =============================================================================
 # DATABASE MANAGER
@@ -20,9 +68,26 @@
 class DatabaseManager:
     """Manages SQLite database connections and operations"""
     
+    # Connection settings for a dashboard: many small reads, occasional writes.
+    # WAL lets readers run while a write is in progress, and NORMAL sync is
+    # still safe in WAL mode while syncing far less often than FULL.
+    PRAGMAS = (
+        "PRAGMA journal_mode = WAL",
+        "PRAGMA synchronous = NORMAL",
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA cache_size = -20000",  # in KiB, about 20 MB
+        "PRAGMA mmap_size = 268435456",  # 256 MB
+    )
+    
+    FETCH_SIZE = 1000  # rows fetched per batch by iter_records
+    BACKUP_PAGES = 1024  # pages copied per step by backup_database
+    
     def __init__(self, db_path="dashboard.db"):
         self.db_path = db_path
         self.connection = None
+        # The connection is shared with the demo's background worker; every
+        # statement, fetch and commit on it runs while holding this lock
+        self.lock = threading.RLock()
         self.setup_logging()
         self.connect()
         self.create_tables()
@@ -42,8 +107,14 @@ def setup_logging(self):
     def connect(self):
         """Establish database connection"""
         try:
-            self.connection = sqlite3.connect(self.db_path)
+            # The demo's background worker also queries through this connection,
+            # serialized by self.lock
+            self.connection = sqlite3.connect(
+                self.db_path, cached_statements=256, check_same_thread=False
+            )
             self.connection.row_factory = sqlite3.Row
+            for pragma in self.PRAGMAS:
+                self.connection.execute(pragma)
             self.logger.info(f"Database connected successfully: {self.db_path}")
         except sqlite3.Error as e:
             self.logger.error(f"Failed to connect to database: {e}")
@@ -52,7 +123,10 @@ def connect(self):
     def disconnect(self):
         """Close database connection"""
         if self.connection:
-            self.connection.close()
+            with self.lock:
+                # Let SQLite refresh the query planner statistics it needs before closing
+                self.connection.execute("PRAGMA optimize")
+                self.connection.close()
             self.logger.info("Database connection closed")
     
     def create_tables(self):
@@ -109,6 +183,11 @@ def create_tables(self):
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_user_id ON orders(user_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status)")
             
+            # The tab loads list newest first, so ORDER BY reads these indexes instead of sorting
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_created ON users(created_date DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_products_created ON products(created_date DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_date ON orders(order_date DESC)")
+            
             self.connection.commit()
             self.logger.info("Database tables created successfully")
             
@@ -119,12 +198,13 @@ def create_tables(self):
     def execute_query(self, query, parameters=None):
         """Execute a database query with error handling"""
         try:
-            cursor = self.connection.cursor()
-            if parameters:
-                cursor.execute(query, parameters)
-            else:
-                cursor.execute(query)
-            return cursor
+            with self.lock:
+                cursor = self.connection.cursor()
+                if parameters:
+                    cursor.execute(query, parameters)
+                else:
+                    cursor.execute(query)
+                return cursor
         except sqlite3.Error as e:
             self.logger.error(f"Query execution failed: {e}")
             raise e
@@ -132,59 +212,125 @@ def execute_query(self, query, parameters=None):
     def insert_record(self, table, data):
         """Insert a record into the specified table"""
         try:
-            columns = ', '.join(data.keys())
-            placeholders = ', '.join(['?' for _ in data])
-            query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
-            
-            cursor = self.execute_query(query, list(data.values()))
-            self.connection.commit()
-            
-            record_id = cursor.lastrowid
-            self.logger.info(f"Record inserted into {table} with ID: {record_id}")
-            return record_id
+            with self.lock:
+                query = build_insert_sql(table, tuple(data))
+                cursor = self.execute_query(query, list(data.values()))
+                self.connection.commit()
+                
+                record_id = cursor.lastrowid
+                self.logger.info(f"Record inserted into {table} with ID: {record_id}")
+                return record_id
             
         except sqlite3.Error as e:
             self.logger.error(f"Failed to insert record into {table}: {e}")
             raise e
     
-    def select_records(self, table, conditions=None, order_by=None, limit=None):
-        """Select records from the specified table"""
+    def insert_many(self, table, rows):
+        """Insert several records into the specified table in one transaction"""
+        if not rows:
+            return 0
+        
         try:
-            query = f"SELECT * FROM {table}"
-            parameters = []
-            
-            if conditions:
-                where_clause = ' AND '.join([f"{k} = ?" for k in conditions.keys()])
-                query += f" WHERE {where_clause}"
-                parameters.extend(conditions.values())
+            with self.lock:
+                # Every row must have the same keys as the first one
+                columns = tuple(rows[0])
+                query = build_insert_sql(table, columns)
+                parameters = [tuple(row[column] for column in columns) for row in rows]
+                
+                # The connection context manager commits once, or rolls back on error
+                with self.connection:
+                    cursor = self.connection.executemany(query, parameters)
+                
+                rows_inserted = cursor.rowcount
+                self.logger.info(f"Inserted {rows_inserted} records into {table}")
+                return rows_inserted
             
-            if order_by:
-                query += f" ORDER BY {order_by}"
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to insert records into {table}: {e}")
+            raise e
+    
+    def select_cursor(self, table, conditions=None, order_by=None, limit=None, offset=None, columns=None):
+        """Execute a SELECT on the specified table and return its cursor"""
+        parameters = []
+        condition_columns = ()
+        
+        if conditions:
+            condition_columns = tuple(conditions)
+            parameters.extend(conditions.values())
+        
+        # SQLite needs a LIMIT before OFFSET; -1 means no limit
+        paged = bool(limit or offset)
+        if paged:
+            parameters.extend((limit or -1, offset or 0))
+        
+        query = build_select_sql(table, condition_columns, order_by, paged, columns)
+        return self.execute_query(query, parameters)
+    
+    def select_records(self, table, conditions=None, order_by=None, limit=None, offset=None):
+        """Select records from the specified table"""
+        try:
+            with self.lock:
+                return self.select_cursor(table, conditions, order_by, limit, offset).fetchall()
             
-            if limit:
-                query += f" LIMIT {limit}"
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to select records from {table}: {e}")
+            raise e
+    
+    def select_rows(self, table, columns, conditions=None, order_by=None, limit=None, offset=None):
+        """Select a tuple of columns from the specified table as plain tuples in that order"""
+        try:
+            with self.lock:
+                cursor = self.select_cursor(table, conditions, order_by, limit, offset, tuple(columns))
+                # Plain tuples skip building a sqlite3.Row for every record
+                cursor.row_factory = None
+                return cursor.fetchall()
             
-            cursor = self.execute_query(query, parameters)
-            return cursor.fetchall()
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to select rows from {table}: {e}")
+            raise e
+    
+    def iter_records(self, table, conditions=None, order_by=None, limit=None, offset=None):
+        """Yield records from the specified table, fetching FETCH_SIZE rows at a time"""
+        try:
+            # The lock is taken per batch, so it is never held while the caller runs
+            with self.lock:
+                cursor = self.select_cursor(table, conditions, order_by, limit, offset)
+                cursor.arraysize = self.FETCH_SIZE
+            while True:
+                with self.lock:
+                    rows = cursor.fetchmany()
+                if not rows:
+                    break
+                yield from rows
             
         except sqlite3.Error as e:
             self.logger.error(f"Failed to select records from {table}: {e}")
             raise e
     
+    def count_records(self, table, conditions=None):
+        """Count the records in the specified table"""
+        try:
+            with self.lock:
+                conditions = conditions or {}
+                query = build_count_sql(table, tuple(conditions))
+                return self.execute_query(query, list(conditions.values())).fetchone()[0]
+            
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to count records in {table}: {e}")
+            raise e
+    
     def update_record(self, table, data, conditions):
         """Update records in the specified table"""
         try:
-            set_clause = ', '.join([f"{k} = ?" for k in data.keys()])
-            where_clause = ' AND '.join([f"{k} = ?" for k in conditions.keys()])
-            query = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
-            
-            parameters = list(data.values()) + list(conditions.values())
-            cursor = self.execute_query(query, parameters)
-            self.connection.commit()
-            
-            rows_affected = cursor.rowcount
-            self.logger.info(f"Updated {rows_affected} records in {table}")
-            return rows_affected
+            with self.lock:
+                query = build_update_sql(table, tuple(data), tuple(conditions))
+                parameters = list(data.values()) + list(conditions.values())
+                cursor = self.execute_query(query, parameters)
+                self.connection.commit()
+                
+                rows_affected = cursor.rowcount
+                self.logger.info(f"Updated {rows_affected} records in {table}")
+                return rows_affected
             
         except sqlite3.Error as e:
             self.logger.error(f"Failed to update records in {table}: {e}")
@@ -193,15 +339,14 @@ def update_record(self, table, data, conditions):
     def delete_record(self, table, conditions):
         """Delete records from the specified table"""
         try:
-            where_clause = ' AND '.join([f"{k} = ?" for k in conditions.keys()])
-            query = f"DELETE FROM {table} WHERE {where_clause}"
-            
-            cursor = self.execute_query(query, list(conditions.values()))
-            self.connection.commit()
-            
-            rows_affected = cursor.rowcount
-            self.logger.info(f"Deleted {rows_affected} records from {table}")
-            return rows_affected
+            with self.lock:
+                query = build_delete_sql(table, tuple(conditions))
+                cursor = self.execute_query(query, list(conditions.values()))
+                self.connection.commit()
+                
+                rows_affected = cursor.rowcount
+                self.logger.info(f"Deleted {rows_affected} records from {table}")
+                return rows_affected
             
         except sqlite3.Error as e:
             self.logger.error(f"Failed to delete records from {table}: {e}")
@@ -210,8 +355,9 @@ def delete_record(self, table, conditions):
     def get_table_info(self, table):
         """Get information about table structure"""
         try:
-            cursor = self.execute_query(f"PRAGMA table_info({table})")
-            return cursor.fetchall()
+            with self.lock:
+                cursor = self.execute_query(f"PRAGMA table_info({table})")
+                return cursor.fetchall()
         except sqlite3.Error as e:
             self.logger.error(f"Failed to get table info for {table}: {e}")
             raise e
@@ -219,13 +365,153 @@ def get_table_info(self, table):
     def backup_database(self, backup_path):
         """Create a backup of the database"""
         try:
-            import shutil
-            shutil.copy2(self.db_path, backup_path)
+            # The online backup API gives a consistent copy even while the
+            # database is in use. It reads through its own connection, opened
+            # in the calling thread, so the shared connection stays free meanwhile.
+            source = sqlite3.connect(self.db_path)
+            backup = sqlite3.connect(backup_path)
+            try:
+                source.backup(backup, pages=self.BACKUP_PAGES)
+            finally:
+                backup.close()
+                source.close()
             self.logger.info(f"Database backed up to: {backup_path}")
         except Exception as e:
             self.logger.error(f"Failed to backup database: {e}")
             raise e
 
+# =============================================================================
+# LAZY TREEVIEW
+# =============================================================================
+
+class LazyTreeview(ttk.Treeview):
+    """Treeview that only creates items for the rows currently in view"""
+    
+    WHEEL_STEP = 3  # rows scrolled per mouse wheel notch
+    PAGE_BUFFER = 50  # extra rows fetched on each side of the visible window
+    
+    # Insert rows at index with ids counting up from first, or replace all
+    # items with them, so each change costs one Python-to-Tcl call
+    ROW_PROCS = """
+        proc lazytreeview_insert_rows {tree index first rows} {
+            set id $first
+            foreach values $rows {
+                $tree insert {} $index -id $id -values $values
+                incr id
+                if {$index ne "end"} {incr index}
+            }
+        }
+        proc lazytreeview_show_rows {tree first rows} {
+            $tree delete [$tree children {}]
+            lazytreeview_insert_rows $tree end $first $rows
+        }
+    """
+    
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        # Rows are fetched on demand with fetch_page(offset, limit)
+        self.row_count = 0
+        self.fetch_page = None
+        self.page_start = 0
+        self.page_rows = []
+        self.first_row = 0
+        # Rows that currently have items, as the range [shown_first, shown_last)
+        self.shown_first = 0
+        self.shown_last = 0
+        self.visible_count = int(self.cget("height"))
+        self.row_height = int(ttk.Style(self).lookup("Treeview", "rowheight") or 20)
+        self.scrollbar = None
+        self.tk.eval(self.ROW_PROCS)
+        
+        self.bind("<Configure>", self.on_resize)
+        self.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.bind("<Button-4>", self.on_mouse_wheel)
+        self.bind("<Button-5>", self.on_mouse_wheel)
+    
+    def set_scrollbar(self, scrollbar):
+        """Connect a vertical scrollbar to the window of rows"""
+        self.scrollbar = scrollbar
+        scrollbar.configure(command=self.yview)
+    
+    def set_source(self, row_count, fetch_page):
+        """Show row_count rows, fetched as tuples of column values by fetch_page(offset, limit)"""
+        self.row_count = row_count
+        self.fetch_page = fetch_page
+        self.page_start = 0
+        self.page_rows = []
+        self.first_row = 0
+        # The new rows may differ, so none of the current items can be reused
+        self.shown_first = self.shown_last = 0
+        self.render_rows()
+    
+    def get_rows(self, first, last):
+        """Return rows first to last, fetching a new page when they are not cached"""
+        page_end = self.page_start + len(self.page_rows)
+        if first < self.page_start or last > page_end:
+            self.page_start = max(0, first - self.PAGE_BUFFER)
+            limit = last - self.page_start + self.PAGE_BUFFER
+            self.page_rows = self.fetch_page(self.page_start, limit)
+        return self.page_rows[first - self.page_start:last - self.page_start]
+    
+    def render_rows(self):
+        """Create items for the visible rows starting at first_row"""
+        total = self.row_count
+        first = max(0, min(self.first_row, total - self.visible_count))
+        last = min(first + self.visible_count, total)
+        self.first_row = first
+        
+        shown_first, shown_last = self.shown_first, self.shown_last
+        self.shown_first, self.shown_last = first, last
+        
+        if first < shown_last and last > shown_first:
+            # Item ids are row positions: keep the items still in view (and
+            # their selection), delete the rest and add only the new rows
+            gone = [*range(shown_first, min(shown_last, first)),
+                    *range(max(shown_first, last), shown_last)]
+            if gone:
+                self.delete(*gone)
+            if first < shown_first:
+                rows = tuple(self.get_rows(first, shown_first))
+                self.tk.call("lazytreeview_insert_rows", self, 0, first, rows)
+            if last > shown_last:
+                rows = tuple(self.get_rows(shown_last, last))
+                self.tk.call("lazytreeview_insert_rows", self, "end", shown_last, rows)
+        else:
+            rows = tuple(self.get_rows(first, last)) if last > first else ()
+            self.tk.call("lazytreeview_show_rows", self, first, rows)
+        
+        if self.scrollbar is not None:
+            self.scrollbar.set(*self.yview())
+    
+    def yview(self, *args):
+        """Scroll the window of rows, or return its position when called without arguments"""
+        total = self.row_count
+        if not args:
+            if not total:
+                return (0.0, 1.0)
+            return (self.first_row / total, min(self.first_row + self.visible_count, total) / total)
+        
+        if args[0] == "moveto":
+            self.first_row = int(float(args[1]) * total)
+        else:
+            step = self.visible_count if args[2] == "pages" else 1
+            self.first_row += int(args[1]) * step
+        self.render_rows()
+    
+    def on_mouse_wheel(self, event):
+        """Scroll the window of rows with the mouse wheel"""
+        direction = -1 if event.num == 4 or event.delta > 0 else 1
+        self.first_row += direction * self.WHEEL_STEP
+        self.render_rows()
+        return "break"
+    
+    def on_resize(self, event):
+        """Show as many rows as fit below the heading"""
+        count = max(1, event.height // self.row_height - 1)
+        if count != self.visible_count:
+            self.visible_count = count
+            self.render_rows()
+
 # =============================================================================
 # BASIC DATABASE DEMO
 # =============================================================================
@@ -233,11 +519,23 @@ def backup_database(self, backup_path):
 class BasicDatabaseDemo:
     """Demo application showing basic database operations"""
     
+    POLL_INTERVAL = 50  # ms between checks for finished background work
+    
+    # Database columns read for each tab, in Treeview column order
+    USER_FIELDS = ("id", "username", "email", "full_name", "role", "is_active", "created_date")
+    PRODUCT_FIELDS = ("id", "name", "description", "price", "category", "stock_quantity", "created_date")
+    ORDER_FIELDS = ("id", "user_id", "product_id", "quantity", "total_price", "status", "order_date")
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Basic Database Operations Demo")
         self.root.geometry("1000x700")
         
+        # A single worker runs slow database work one job at a time
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        # after() ids of the pending result checks, keyed by future
+        self.pending_checks = {}
+        self.closing = False
         self.db_manager = DatabaseManager()
         self.create_widgets()
         self.load_sample_data()
@@ -341,15 +639,15 @@ def create_users_table(self):
         
         # Treeview
         columns = ("ID", "Username", "Email", "Full Name", "Role", "Active", "Created")
-        self.users_tree = ttk.Treeview(self.users_tab, columns=columns, show="headings", height=15)
+        self.users_tree = LazyTreeview(self.users_tab, columns=columns, show="headings", height=15)
         
         for col in columns:
             self.users_tree.heading(col, text=col)
             self.users_tree.column(col, width=100)
         
         # Scrollbar
-        scrollbar = ttk.Scrollbar(self.users_tab, orient="vertical", command=self.users_tree.yview)
-        self.users_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar = ttk.Scrollbar(self.users_tab, orient="vertical")
+        self.users_tree.set_scrollbar(scrollbar)
         
         self.users_tree.pack(side="left", fill="both", expand=True, padx=10, pady=5)
         scrollbar.pack(side="right", fill="y", pady=5)
@@ -365,15 +663,15 @@ def create_products_table(self):
         
         # Treeview
         columns = ("ID", "Name", "Description", "Price", "Category", "Stock", "Created")
-        self.products_tree = ttk.Treeview(self.products_tab, columns=columns, show="headings", height=15)
+        self.products_tree = LazyTreeview(self.products_tab, columns=columns, show="headings", height=15)
         
         for col in columns:
             self.products_tree.heading(col, text=col)
             self.products_tree.column(col, width=100)
         
         # Scrollbar
-        scrollbar = ttk.Scrollbar(self.products_tab, orient="vertical", command=self.products_tree.yview)
-        self.products_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar = ttk.Scrollbar(self.products_tab, orient="vertical")
+        self.products_tree.set_scrollbar(scrollbar)
         
         self.products_tree.pack(side="left", fill="both", expand=True, padx=10, pady=5)
         scrollbar.pack(side="right", fill="y", pady=5)
@@ -388,15 +686,15 @@ def create_orders_table(self):
         
         # Treeview
         columns = ("ID", "User ID", "Product ID", "Quantity", "Total Price", "Status", "Order Date")
-        self.orders_tree = ttk.Treeview(self.orders_tab, columns=columns, show="headings", height=15)
+        self.orders_tree = LazyTreeview(self.orders_tab, columns=columns, show="headings", height=15)
         
         for col in columns:
             self.orders_tree.heading(col, text=col)
             self.orders_tree.column(col, width=100)
         
         # Scrollbar
-        scrollbar = ttk.Scrollbar(self.orders_tab, orient="vertical", command=self.orders_tree.yview)
-        self.orders_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar = ttk.Scrollbar(self.orders_tab, orient="vertical")
+        self.orders_tree.set_scrollbar(scrollbar)
         
         self.orders_tree.pack(side="left", fill="both", expand=True, padx=10, pady=5)
         scrollbar.pack(side="right", fill="y", pady=5)
@@ -473,72 +771,60 @@ def add_product(self):
     
     def load_users(self):
         """Load and display users"""
-        try:
-            # Clear existing items
-            for item in self.users_tree.get_children():
-                self.users_tree.delete(item)
-            
-            # Load users from database
-            users = self.db_manager.select_records('users', order_by='created_date DESC')
-            
-            for user in users:
-                self.users_tree.insert("", "end", values=(
-                    user['id'],
-                    user['username'],
-                    user['email'],
-                    user['full_name'],
-                    user['role'],
-                    "Yes" if user['is_active'] else "No",
-                    user['created_date']
-                ))
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load users: {e}")
+        # Only the count is read here; pages are queried as the table scrolls
+        self.run_in_background(
+            partial(self.db_manager.count_records, 'users'),
+            partial(self.users_tree.set_source, fetch_page=self.fetch_users),
+            lambda e: messagebox.showerror("Error", f"Failed to load users: {e}")
+        )
+    
+    def fetch_users(self, offset, limit):
+        """Fetch a page of users as Treeview rows"""
+        users = self.db_manager.select_rows(
+            'users', self.USER_FIELDS, order_by='created_date DESC', limit=limit, offset=offset
+        )
+        return [
+            (user_id, username, email, full_name, role, "Yes" if is_active else "No", created)
+            for user_id, username, email, full_name, role, is_active, created in users
+        ]
     
     def load_products(self):
         """Load and display products"""
-        try:
-            # Clear existing items
-            for item in self.products_tree.get_children():
-                self.products_tree.delete(item)
-            
-            # Load products from database
-            products = self.db_manager.select_records('products', order_by='created_date DESC')
-            
-            for product in products:
-                self.products_tree.insert("", "end", values=(
-                    product['id'],
-                    product['name'],
-                    product['description'] or '',
-                    f"${product['price']:.2f}",
-                    product['category'],
-                    product['stock_quantity'],
-                    product['created_date']
-                ))
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load products: {e}")
+        # Only the count is read here; pages are queried as the table scrolls
+        self.run_in_background(
+            partial(self.db_manager.count_records, 'products'),
+            partial(self.products_tree.set_source, fetch_page=self.fetch_products),
+            lambda e: messagebox.showerror("Error", f"Failed to load products: {e}")
+        )
+    
+    def fetch_products(self, offset, limit):
+        """Fetch a page of products as Treeview rows"""
+        products = self.db_manager.select_rows(
+            'products', self.PRODUCT_FIELDS, order_by='created_date DESC', limit=limit, offset=offset
+        )
+        return [
+            (product_id, name, description or '', f"${price:.2f}", category, stock, created)
+            for product_id, name, description, price, category, stock, created in products
+        ]
     
     def load_orders(self):
         """Load and display orders"""
-        try:
-            # Clear existing items
-            for item in self.orders_tree.get_children():
-                self.orders_tree.delete(item)
-            
-            # Load orders from database
-            orders = self.db_manager.select_records('orders', order_by='order_date DESC')
-            
-            for order in orders:
-                self.orders_tree.insert("", "end", values=(
-                    order['id'],
-                    order['user_id'],
-                    order['product_id'],
-                    order['quantity'],
-                    f"${order['total_price']:.2f}",
-                    order['status'],
-                    order['order_date']
-                ))
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load orders: {e}")
+        # Only the count is read here; pages are queried as the table scrolls
+        self.run_in_background(
+            partial(self.db_manager.count_records, 'orders'),
+            partial(self.orders_tree.set_source, fetch_page=self.fetch_orders),
+            lambda e: messagebox.showerror("Error", f"Failed to load orders: {e}")
+        )
+    
+    def fetch_orders(self, offset, limit):
+        """Fetch a page of orders as Treeview rows"""
+        orders = self.db_manager.select_rows(
+            'orders', self.ORDER_FIELDS, order_by='order_date DESC', limit=limit, offset=offset
+        )
+        return [
+            (order_id, user_id, product_id, quantity, f"${total_price:.2f}", status, ordered)
+            for order_id, user_id, product_id, quantity, total_price, status, ordered in orders
+        ]
     
     def delete_selected_user(self):
         """Delete the selected user"""
@@ -576,21 +862,71 @@ def delete_selected_product(self):
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to delete product: {e}")
     
+    def run_in_background(self, work, on_done, on_error):
+        """Run work on the worker thread and pass its result to on_done on the Tk thread"""
+        future = self.executor.submit(work)
+        self.schedule_check(future, on_done, on_error)
+    
+    def schedule_check(self, future, on_done, on_error):
+        """Check a background job again after POLL_INTERVAL"""
+        self.pending_checks[future] = self.root.after(
+            self.POLL_INTERVAL, self.check_background, future, on_done, on_error
+        )
+    
+    def check_background(self, future, on_done, on_error):
+        """Deliver a finished background result, or check again shortly"""
+        self.pending_checks.pop(future, None)
+        if self.closing:
+            return
+        
+        if not future.done():
+            self.schedule_check(future, on_done, on_error)
+            return
+        
+        try:
+            result = future.result()
+        except Exception as e:
+            on_error(e)
+        else:
+            on_done(result)
+    
+    def shutdown(self):
+        """Stop background work and close the database before the window goes away"""
+        self.closing = True
+        for after_id in self.pending_checks.values():
+            self.root.after_cancel(after_id)
+        self.pending_checks.clear()
+        
+        self.executor.shutdown(wait=True)
+        self.db_manager.disconnect()
+    
     def refresh_data(self):
         """Refresh all data displays"""
-        self.load_users()
-        self.load_products()
-        self.load_orders()
+        def count_all():
+            return tuple(self.db_manager.count_records(table) for table in ('users', 'products', 'orders'))
+        
+        self.run_in_background(
+            count_all,
+            self.apply_refresh,
+            lambda e: messagebox.showerror("Error", f"Failed to refresh data: {e}")
+        )
+    
+    def apply_refresh(self, counts):
+        """Show the refreshed tables once their row counts are known"""
+        users_count, products_count, orders_count = counts
+        self.users_tree.set_source(users_count, self.fetch_users)
+        self.products_tree.set_source(products_count, self.fetch_products)
+        self.orders_tree.set_source(orders_count, self.fetch_orders)
         messagebox.showinfo("Success", "Data refreshed successfully")
     
     def backup_database(self):
         """Create a backup of the database"""
-        try:
-            backup_path = f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
-            self.db_manager.backup_database(backup_path)
-            messagebox.showinfo("Success", f"Database backed up to: {backup_path}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to backup database: {e}")
+        backup_path = f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
+        self.run_in_background(
+            partial(self.db_manager.backup_database, backup_path),
+            lambda result: messagebox.showinfo("Success", f"Database backed up to: {backup_path}"),
+            lambda e: messagebox.showerror("Error", f"Failed to backup database: {e}")
+        )
     
     def show_table_info(self):
         """Show information about database tables"""
@@ -647,8 +983,7 @@ def load_sample_data(self):
                 {'username': 'jane_smith', 'email': 'jane@example.com', 'full_name': 'Jane Smith', 'role': 'user'}
             ]
             
-            for user_data in sample_users:
-                self.db_manager.insert_record('users', user_data)
+            self.db_manager.insert_many('users', sample_users)
             
             # Sample products
             sample_products = [
@@ -657,13 +992,12 @@ def load_sample_data(self):
                 {'name': 'Desk Chair', 'description': 'Ergonomic office chair', 'price': 199.99, 'category': 'Furniture', 'stock_quantity': 5}
             ]
             
-            for product_data in sample_products:
-                self.db_manager.insert_record('products', product_data)
+            self.db_manager.insert_many('products', sample_products)
             
-            self.logger.info("Sample data loaded successfully")
+            self.db_manager.logger.info("Sample data loaded successfully")
             
         except Exception as e:
-            self.logger.error(f"Failed to load sample data: {e}")
+            self.db_manager.logger.error(f"Failed to load sample data: {e}")
 
 # =============================================================================
 # MAIN APPLICATION
@@ -690,7 +1024,7 @@ def create_widgets(self):
     def on_closing(self):
         """Handle application closing"""
         if hasattr(self.demo, 'db_manager'):
-            self.demo.db_manager.disconnect()
+            self.demo.shutdown()
         self.root.destroy()
 
 def main():
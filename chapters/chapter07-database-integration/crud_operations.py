@@ -45,6 +45,9 @@ def validate(self, value):
 class EmailValidator(Validator):
     """Validator for email addresses"""
     
+    # Compiled once for every validator instance and call
+    EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+    
     def __init__(self, error_message="Invalid email address"):
         super().__init__(error_message)
     
@@ -52,8 +55,7 @@ def validate(self, value):
         if not value:
             return True, None  # Allow empty if not required
         
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, value):
+        if not self.EMAIL_PATTERN.match(value):
             return False, self.error_message
         return True, None
 
@@ -91,6 +93,8 @@ def __init__(self, parent, label="", validators=None, **kwargs):
         self.label = label
         self.validators = validators or []
         self.error_label = None
+        # Tracked here so key releases don't have to ask Tk whether an error is shown
+        self.has_error = False
         self.create_widgets()
     
     def create_widgets(self):
@@ -151,18 +155,20 @@ def validate_on_focus_out(self, event=None):
     def validate_on_key_release(self, event=None):
         """Validate on key release (for real-time validation)"""
         # Only clear error on key release, don't show new errors
-        if self.error_label.cget("text"):
+        if self.has_error:
             self.clear_error()
     
     def show_error(self, message):
         """Show error message"""
         self.error_label.configure(text=message)
         self.entry.configure(bg="#FFE6E6")  # Light red background
+        self.has_error = True
     
     def clear_error(self):
         """Clear error message"""
         self.error_label.configure(text="")
         self.entry.configure(bg="white")
+        self.has_error = False
 
 class SearchFilterFrame(tk.Frame):
     """Search and filter interface"""